@@ -2,50 +2,79 @@
 Data loader utilities for reading CSV data
 """
 import csv
-from typing import List, Dict, Optional
+import hashlib
+import os
+import pickle
+import re
+import sys
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Iterator, List, Dict, Optional, Pattern, Tuple
 from pathlib import Path
 from api.models import School, Standing, Conference, SchoolPlacement, ConferenceStandings
 
+# Seasons with a "<year> Conference Team Place" column in the main CSV
+YEARS = [2020, 2021, 2022, 2023, 2024, 2025]
+
+# Bit 0 of a conference's year mask is this year
+YEAR_BASE = 1900
+
+# Read buffer for the CSV files; large enough to take typical files in one read
+READ_BUFFER_SIZE = 1 << 20
+
+# Upper bound on memoized query results; conference names come from user input
+QUERY_CACHE_SIZE = 512
+
+# Bump when the parsed objects change shape so old sidecar caches are ignored
+CACHE_VERSION = 3
+
 
 class DataLoader:
     """Loads and manages NAIA wrestling data from CSV files"""
 
-    def __init__(self, main_csv_path: str, sorted_csv_path: str):
+    def __init__(self, main_csv_path: str, sorted_csv_path: str, use_cache: bool = True):
         self.main_csv_path = Path(main_csv_path)
         self.sorted_csv_path = Path(sorted_csv_path)
-        self.schools_data: List[Dict] = []
+        self.use_cache = use_cache
         self.standings_data: List[Standing] = []
         self.conferences_cache: Dict[str, Conference] = {}
+        self._schools_cache: List[School] = []
+        self._school_by_name_lower: Dict[str, School] = {}
+        self._schools_lower: List[Tuple[str, School]] = []
+        self._conf_lower: Dict[str, Conference] = {}
+        self._conf_names_lower: List[Tuple[str, Conference]] = []
+        self._conf_by_name_lower: Dict[str, List[Conference]] = {}
+        self._conference_lc: Dict[str, str] = {}
+        self._interned: Dict[str, str] = {}
+        self._school_matcher: Tuple[str, Optional[Pattern]] = ('', None)
+        self._conf_matcher: Tuple[str, Optional[Pattern]] = ('', None)
+        self._by_year: Dict[int, List[Standing]] = {}
+        self._by_conf: Dict[str, List[Standing]] = {}
+        self._by_year_conf: Dict[Tuple[int, str, str, str, str], Tuple[Standing, ...]] = {}
+        self._by_year_sdg: Dict[Tuple[int, str, str, str], Tuple[Standing, ...]] = {}
+        self._conf_by_sdg: Dict[Tuple[str, str, str], List[Conference]] = {}
+        self._conf_year_mask: Dict[Tuple[str, str, str, str], int] = {}
+        self._query_cache: Dict[Tuple, Any] = {}
         self.loaded = False
 
     def load_data(self) -> bool:
-        """Load data from CSV files"""
+        """Load data from CSV files, reusing the pickled sidecar when it is current"""
         try:
-            # Load main CSV for school details
-            with open(self.main_csv_path, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                self.schools_data = list(reader)
-
-            # Load sorted CSV for standings
-            with open(self.sorted_csv_path, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                standings_rows = list(reader)
-
-            self.standings_data = [
-                Standing(
-                    sport=row.get('Sport', 'wrestling'),
-                    division=row.get('Division', 'naia'),
-                    gender=row.get('Gender', 'mens'),
-                    year=int(row['Year']),
-                    conference=row['Conference'],
-                    place=int(row['Place']),
-                    school=row['School']
-                )
-                for row in standings_rows
-            ]
+            started = time.perf_counter()
+            stamps = self._csv_stamps()
+            source = "cache"
+            if not (self.use_cache and self._load_cache(stamps)):
+                source = "CSV"
+                self._parse_csvs()
+                if self.use_cache:
+                    self._save_cache(stamps)
+            print(f"Read data from {source} in {(time.perf_counter() - started) * 1000:.1f} ms")
 
             # Build conferences cache
             self._build_conferences_cache()
+            self._build_lookup_caches()
+            self._query_cache.clear()
 
             self.loaded = True
             return True
@@ -53,22 +82,142 @@ class DataLoader:
             print(f"Error loading data: {e}")
             return False
 
+    def _parse_csvs(self):
+        """Parse both CSV files into standings and school objects"""
+        # The files are independent, so read them concurrently to overlap disk I/O
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            schools_future = executor.submit(self._read_schools)
+            standings_future = executor.submit(self._read_standings)
+            self._schools_cache = schools_future.result()
+            self.standings_data = standings_future.result()
+
+    def _read_schools(self) -> List[School]:
+        """Parse the main CSV into School objects"""
+        # Load main CSV for school details, parsing rows as they are read
+        with open(self.main_csv_path, 'r', encoding='utf-8', newline='', buffering=READ_BUFFER_SIZE) as f:
+            reader = csv.reader(f)
+            columns = self._column_index(next(reader, []))
+
+            # Resolve the per-year place columns once rather than per row
+            year_columns = [
+                (year, columns[f'{year} Conference Team Place'])
+                for year in YEARS
+                if f'{year} Conference Team Place' in columns
+            ]
+
+            # Only the parsed School objects are kept, not the raw rows
+            return [self._parse_school(row, columns, year_columns) for row in reader]
+
+    def _read_standings(self) -> List[Standing]:
+        """Parse the sorted CSV into Standing objects"""
+        with open(self.sorted_csv_path, 'r', encoding='utf-8', newline='', buffering=READ_BUFFER_SIZE) as f:
+            reader = csv.reader(f)
+            idx = self._column_index(next(reader, []))
+
+            sport_i, division_i, gender_i = idx.get('Sport'), idx.get('Division'), idx.get('Gender')
+            year_i, conf_i, place_i, school_i = idx['Year'], idx['Conference'], idx['Place'], idx['School']
+
+            # Repeated values are interned so every row shares one string object
+            intern = sys.intern
+            return [
+                Standing(
+                    sport=intern(row[sport_i] if sport_i is not None else 'wrestling'),
+                    division=intern(row[division_i] if division_i is not None else 'naia'),
+                    gender=intern(row[gender_i] if gender_i is not None else 'mens'),
+                    year=int(row[year_i]),
+                    conference=intern(row[conf_i]),
+                    place=int(row[place_i]),
+                    school=intern(row[school_i])
+                )
+                for row in reader
+            ]
+
+    @staticmethod
+    def _column_index(header: List[str]) -> Dict[str, int]:
+        """Map CSV header names to column positions"""
+        return {name: i for i, name in enumerate(header)}
+
+    def _csv_stamps(self) -> Tuple[Tuple[int, int], ...]:
+        """(mtime_ns, size) of each CSV, used to validate the sidecar cache"""
+        stamps = []
+        for path in (self.main_csv_path, self.sorted_csv_path):
+            stat = path.stat()
+            stamps.append((stat.st_mtime_ns, stat.st_size))
+        return tuple(stamps)
+
+    def _cache_path(self) -> Path:
+        """Sidecar file next to the sorted CSV, one per CSV pair however the paths are spelled"""
+        key = repr((str(self.main_csv_path.resolve()), str(self.sorted_csv_path.resolve())))
+        digest = hashlib.sha1(key.encode('utf-8')).hexdigest()[:16]
+        return self.sorted_csv_path.parent / f".loader_cache_{digest}.pkl"
+
+    def _load_cache(self, stamps: Tuple[Tuple[int, int], ...]) -> bool:
+        """Restore parsed data from the sidecar; returns False if missing or stale"""
+        cache_file = self._cache_path()
+        if not cache_file.exists():
+            return False
+
+        try:
+            with open(cache_file, 'rb') as f:
+                cached = pickle.load(f)
+        except Exception as e:
+            print(f"Ignoring unreadable data cache {cache_file}: {e}")
+            return False
+
+        if cached.get('version') != CACHE_VERSION or cached.get('stamps') != stamps:
+            return False
+
+        self.standings_data = cached['standings']
+        self._schools_cache = cached['schools']
+        return True
+
+    def _save_cache(self, stamps: Tuple[Tuple[int, int], ...]):
+        """Write parsed data to the sidecar, replacing this CSV pair's previous cache"""
+        cache_file = self._cache_path()
+        payload = {
+            'version': CACHE_VERSION,
+            'stamps': stamps,
+            'standings': self.standings_data,
+            'schools': self._schools_cache,
+        }
+
+        try:
+            # Write then rename so concurrent workers never read a partial file
+            tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+            with open(tmp_file, 'wb') as f:
+                pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_file, cache_file)
+        except OSError as e:
+            # A read-only deployment just parses the CSVs on every start
+            print(f"Could not write data cache {cache_file}: {e}")
+
     def _build_conferences_cache(self):
         """Build cache of conferences from standings data"""
         # Key: (conference_name, sport, division, gender)
         conf_data: Dict[tuple, Dict] = {}
+        by_year: Dict[int, List[Standing]] = defaultdict(list)
+        by_conf: Dict[str, List[Standing]] = defaultdict(list)
+        by_year_conf: Dict[Tuple[int, str, str, str, str], List[Standing]] = defaultdict(list)
+        by_year_sdg: Dict[Tuple[int, str, str, str], List[Standing]] = defaultdict(list)
 
         for standing in self.standings_data:
+            by_year[standing.year].append(standing)
+            by_conf[standing.conference].append(standing)
+            by_year_conf[(standing.year, standing.conference, standing.sport, standing.division, standing.gender)].append(standing)
+            by_year_sdg[(standing.year, standing.sport, standing.division, standing.gender)].append(standing)
+
             key = (standing.conference, standing.sport, standing.division, standing.gender)
 
             if key not in conf_data:
                 conf_data[key] = {
                     'schools': set(),
-                    'years': set()
+                    'year_mask': 0
                 }
 
             conf_data[key]['schools'].add(standing.school)
-            conf_data[key]['years'].add(standing.year)
+            conf_data[key]['year_mask'] |= 1 << (standing.year - YEAR_BASE)
+
+        self._conf_year_mask = {key: data['year_mask'] for key, data in conf_data.items()}
 
         self.conferences_cache = {
             f"{name}|{sport}|{division}|{gender}": Conference(
@@ -77,104 +226,240 @@ class DataLoader:
                 division=division,
                 gender=gender,
                 schools=sorted(list(data['schools'])),
-                years_active=sorted(list(data['years']))
+                years_active=self._decode_years(data['year_mask'])
             )
             for (name, sport, division, gender), data in conf_data.items()
         }
 
-    def get_all_schools(self, sport: Optional[str] = None, division: Optional[str] = None, gender: Optional[str] = None) -> List[School]:
-        """Get all schools with their placements, optionally filtered by sport/division/gender"""
-        schools = []
-
-        for row in self.schools_data:
-            # Filter by sport/division/gender if specified
-            row_sport = row.get('Sport', 'wrestling')
-            row_division = row.get('Division', 'naia')
-            row_gender = row.get('Gender', 'mens')
-
-            if sport and row_sport != sport:
-                continue
-            if division and row_division != division:
-                continue
-            if gender and row_gender != gender:
-                continue
+        # Index standings so getters do hash lookups instead of full scans
+        for bucket in by_conf.values():
+            bucket.sort(key=lambda x: (x.year, x.place))
+        for bucket in by_year_conf.values():
+            bucket.sort(key=lambda x: x.place)
+        self._by_year = dict(by_year)
+        self._by_conf = dict(by_conf)
+        self._by_year_conf = {key: tuple(bucket) for key, bucket in by_year_conf.items()}
+        self._by_year_sdg = {key: tuple(bucket) for key, bucket in by_year_sdg.items()}
+
+        # Group conferences by (sport, division, gender) for fully-filtered requests
+        conf_by_sdg: Dict[Tuple[str, str, str], List[Conference]] = defaultdict(list)
+        for conf in self.conferences_cache.values():
+            conf_by_sdg[(conf.sport, conf.division, conf.gender)].append(conf)
+        self._conf_by_sdg = dict(conf_by_sdg)
+
+    @staticmethod
+    def _decode_years(year_mask: int) -> List[int]:
+        """Expand a year bitmask into a sorted list of years"""
+        return [YEAR_BASE + i for i in range(year_mask.bit_length()) if year_mask >> i & 1]
+
+    def _build_lookup_caches(self):
+        """Precompute lowercase names so lookups don't re-lower every row per call"""
+        self._schools_lower = [(school.name.lower(), school) for school in self._schools_cache]
+        self._school_by_name_lower = {}
+        for school_lower, school in self._schools_lower:
+            # Keep the first row for duplicate names, as the substring scan would
+            self._school_by_name_lower.setdefault(school_lower, school)
+        self._conf_lower = {key.lower(): conf for key, conf in self.conferences_cache.items()}
+        # Conference names in first-seen order, matching the old scan over standings
+        self._conf_names_lower = [(conf.name.lower(), conf) for conf in self.conferences_cache.values()]
+        self._conf_by_name_lower = {}
+        for name_lower, conf in self._conf_names_lower:
+            self._conf_by_name_lower.setdefault(name_lower, []).append(conf)
+        # Each distinct conference string lowered once; rows share the interned originals
+        self._conference_lc = {
+            item.conference: item.conference.lower()
+            for rows in (self._schools_cache, self.standings_data)
+            for item in rows
+        }
+        # The data's own filter strings, so query values can share their identity.
+        # Strings restored from the pickle sidecar aren't in sys.intern's table.
+        self._interned = {}
+        for rows in (self._schools_cache, self.standings_data):
+            for item in rows:
+                for value in (item.sport, item.division, item.gender, item.conference):
+                    self._interned.setdefault(value, value)
+        self._school_matcher = self._build_matcher(self._school_by_name_lower)
+        self._conf_matcher = self._build_matcher(self._conf_lower)
+
+    def intern(self, value: Optional[str]) -> Optional[str]:
+        """Map a filter value to the loaded data's string so == short-circuits on identity"""
+        return self._interned.get(value, value) if value else value
+
+    @staticmethod
+    def _build_matcher(names) -> Tuple[str, Pattern]:
+        """Compile lowercase names into one haystack and one alternation regex"""
+        haystack = '\n'.join(names)
+        pattern = re.compile('|'.join(re.escape(n) for n in names))
+        return haystack, pattern
+
+    @staticmethod
+    def _may_match(name_lower: str, matcher: Tuple[str, Optional[Pattern]]) -> bool:
+        """Whole-set check: can any stored name contain, or be contained in, name_lower?"""
+        haystack, pattern = matcher
+        if name_lower in haystack:
+            return True
+        return pattern is not None and pattern.search(name_lower) is not None
+
+    @staticmethod
+    def _cell(row: List[str], i: Optional[int], default: str = '') -> str:
+        """Value at column i, or default when the column or cell is missing"""
+        return row[i] if i is not None and i < len(row) else default
+
+    def _parse_school(self, row: List[str], columns: Dict[str, int], year_columns: List[Tuple[int, int]]) -> School:
+        """Build a School with its placements from a main CSV row"""
+        row_sport = sys.intern(self._cell(row, columns.get('Sport'), 'wrestling'))
+        row_division = sys.intern(self._cell(row, columns.get('Division'), 'naia'))
+        row_gender = sys.intern(self._cell(row, columns.get('Gender'), 'mens'))
+        conference = sys.intern(self._cell(row, columns.get('Region')))
+
+        # Get all placements for this school
+        placements = []
+        for year, i in year_columns:
+            place_str = self._cell(row, i).strip()
+            if place_str:
+                placements.append(SchoolPlacement(
+                    sport=row_sport,
+                    division=row_division,
+                    gender=row_gender,
+                    year=year,
+                    place=int(place_str),
+                    conference=conference
+                ))
+
+        return School(
+            name=sys.intern(self._cell(row, columns.get('School'))),
+            sport=row_sport,
+            division=row_division,
+            gender=row_gender,
+            conference=conference,
+            placements=placements
+        )
 
-            school_name = row['School']
-            conference = row['Region']
-
-            # Get all placements for this school
-            placements = []
-            for year in [2020, 2021, 2022, 2023, 2024, 2025]:
-                place_str = row.get(f'{year} Conference Team Place', '').strip()
-                if place_str:
-                    placements.append(SchoolPlacement(
-                        sport=row_sport,
-                        division=row_division,
-                        gender=row_gender,
-                        year=year,
-                        place=int(place_str),
-                        conference=conference
-                    ))
-
-            schools.append(School(
-                name=school_name,
-                sport=row_sport,
-                division=row_division,
-                gender=row_gender,
-                conference=conference,
-                placements=placements
+    def _remember(self, key: Tuple, value: Any) -> Any:
+        """Store a query result until the next load_data call"""
+        if len(self._query_cache) >= QUERY_CACHE_SIZE:
+            self._query_cache.clear()
+        self._query_cache[key] = value
+        return value
+
+    def _conferences_containing(self, conf_lower: str) -> frozenset:
+        """Raw conference names whose lowercase form contains conf_lower, memoized"""
+        key = ('conference_lc', conf_lower)
+        names = self._query_cache.get(key)
+        if names is None:
+            names = self._remember(key, frozenset(
+                name for name, name_lower in self._conference_lc.items() if conf_lower in name_lower
             ))
+        return names
 
+    def _query_schools(
+        self,
+        sport: Optional[str],
+        division: Optional[str],
+        gender: Optional[str],
+        conference: Optional[str] = None
+    ) -> Tuple[School, ...]:
+        """Cached tuple of schools matching the sport/division/gender and conference filters"""
+        conf_lower = conference.lower() if conference else None
+        key = ('schools', sport, division, gender, conf_lower)
+        schools = self._query_cache.get(key)
+        if schools is None:
+            if conf_lower:
+                names = self._conferences_containing(conf_lower)
+                schools = tuple(
+                    school for school in self._query_schools(sport, division, gender)
+                    if school.conference in names
+                )
+            else:
+                schools = tuple(
+                    school for school in self._schools_cache
+                    if (not sport or school.sport == sport)
+                    and (not division or school.division == division)
+                    and (not gender or school.gender == gender)
+                )
+            self._remember(key, schools)
         return schools
 
+    def iter_all_schools(
+        self,
+        sport: Optional[str] = None,
+        division: Optional[str] = None,
+        gender: Optional[str] = None,
+        conference: Optional[str] = None
+    ) -> Iterator[School]:
+        """Iterate schools without allocating a list, optionally filtered by sport/division/gender/conference"""
+        return iter(self._query_schools(sport, division, gender, conference))
+
+    def get_all_schools(
+        self,
+        sport: Optional[str] = None,
+        division: Optional[str] = None,
+        gender: Optional[str] = None,
+        conference: Optional[str] = None
+    ) -> List[School]:
+        """Get all schools with their placements, optionally filtered by sport/division/gender/conference"""
+        # Callers get their own list so they can't alter the cached result
+        return list(self._query_schools(sport, division, gender, conference))
+
+    def get_all_schools_raw(
+        self,
+        sport: Optional[str] = None,
+        division: Optional[str] = None,
+        gender: Optional[str] = None,
+        conference: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Get schools as plain dicts ready for JSON encoding, optionally filtered
+
+        The dicts are cached and shared between calls, so callers must not mutate them.
+        """
+        key = ('schools_raw', sport, division, gender, conference.lower() if conference else None)
+        schools = self._query_cache.get(key)
+        if schools is None:
+            schools = self._remember(key, tuple(
+                school.model_dump() for school in self._query_schools(sport, division, gender, conference)
+            ))
+        return list(schools)
+
     def get_school_by_name(self, name: str, sport: Optional[str] = None, division: Optional[str] = None, gender: Optional[str] = None) -> Optional[School]:
         """Get a specific school by name (case-insensitive partial match)"""
         name_lower = name.lower()
 
-        for row in self.schools_data:
-            school_name = row['School']
-            if name_lower in school_name.lower() or school_name.lower() in name_lower:
-                row_sport = row.get('Sport', 'wrestling')
-                row_division = row.get('Division', 'naia')
-                row_gender = row.get('Gender', 'mens')
-
-                # Filter if specified
-                if sport and row_sport != sport:
-                    continue
-                if division and row_division != division:
-                    continue
-                if gender and row_gender != gender:
-                    continue
-
-                conference = row['Region']
-
-                # Get all placements for this school
-                placements = []
-                for year in [2020, 2021, 2022, 2023, 2024, 2025]:
-                    place_str = row.get(f'{year} Conference Team Place', '').strip()
-                    if place_str:
-                        placements.append(SchoolPlacement(
-                            sport=row_sport,
-                            division=row_division,
-                            gender=row_gender,
-                            year=year,
-                            place=int(place_str),
-                            conference=conference
-                        ))
-
-                return School(
-                    name=school_name,
-                    sport=row_sport,
-                    division=row_division,
-                    gender=row_gender,
-                    conference=conference,
-                    placements=placements
-                )
+        # Exact name hit avoids the substring scan entirely
+        school = self._school_by_name_lower.get(name_lower)
+        if school and self._matches_filters(school, sport, division, gender):
+            return school
+
+        # One C-level pass over all names rules out misses before the row scan
+        if not self._may_match(name_lower, self._school_matcher):
+            return None
+
+        first = name_lower[:1]
+        for school_lower, school in self._schools_lower:
+            # Neither name can contain the other without sharing its first character
+            if first not in school_lower and school_lower[:1] not in name_lower:
+                continue
+            if name_lower in school_lower or school_lower in name_lower:
+                if self._matches_filters(school, sport, division, gender):
+                    return school
 
         return None
 
+    @staticmethod
+    def _matches_filters(item, sport: Optional[str], division: Optional[str], gender: Optional[str]) -> bool:
+        """Check an item's sport/division/gender against optional filters"""
+        if sport and item.sport != sport:
+            return False
+        if division and item.division != division:
+            return False
+        if gender and item.gender != gender:
+            return False
+        return True
+
     def get_all_conferences(self, sport: Optional[str] = None, division: Optional[str] = None, gender: Optional[str] = None) -> List[Conference]:
         """Get all conferences, optionally filtered by sport/division/gender"""
+        if sport and division and gender:
+            return list(self._conf_by_sdg.get((sport, division, gender), []))
+
         conferences = []
         for conf in self.conferences_cache.values():
             if sport and conf.sport != sport:
@@ -190,27 +475,110 @@ class DataLoader:
         """Get a specific conference by name (case-insensitive partial match)"""
         name_lower = name.lower()
 
-        for conf_name, conference in self.conferences_cache.items():
-            if name_lower in conf_name.lower() or conf_name.lower() in name_lower:
+        if not self._may_match(name_lower, self._conf_matcher):
+            return None
+
+        first = name_lower[:1]
+        for conf_lower, conference in self._conf_lower.items():
+            # Neither name can contain the other without sharing its first character
+            if first not in conf_lower and conf_lower[:1] not in name_lower:
+                continue
+            if name_lower in conf_lower or conf_lower in name_lower:
                 return conference
 
         return None
 
-    def get_standings_by_year(self, year: int, sport: Optional[str] = None, division: Optional[str] = None, gender: Optional[str] = None) -> List[Standing]:
-        """Get all standings for a specific year, optionally filtered"""
-        standings = []
-        for s in self.standings_data:
-            if s.year != year:
-                continue
-            if sport and s.sport != sport:
-                continue
-            if division and s.division != division:
-                continue
-            if gender and s.gender != gender:
+    def _resolve_conference(
+        self,
+        conference: str,
+        sport: Optional[str] = None,
+        division: Optional[str] = None,
+        gender: Optional[str] = None
+    ) -> Optional[Conference]:
+        """Resolve a partial conference name to the first matching conference, memoized"""
+        key = ('resolve', conference, sport, division, gender)
+        if key in self._query_cache:
+            return self._query_cache[key]
+        return self._remember(key, self._find_conference(conference.lower(), sport, division, gender))
+
+    def _find_conference(
+        self,
+        conf_lower: str,
+        sport: Optional[str] = None,
+        division: Optional[str] = None,
+        gender: Optional[str] = None
+    ) -> Optional[Conference]:
+        """First conference whose name contains conf_lower and passes the filters"""
+        # Exact name hit skips the substring scan
+        for conf in self._conf_by_name_lower.get(conf_lower, []):
+            if self._matches_filters(conf, sport, division, gender):
+                return conf
+
+        first = conf_lower[:1]
+        for name_lower, conf in self._conf_names_lower:
+            # The query can't be inside a name that lacks its first character
+            if first not in name_lower:
                 continue
-            standings.append(s)
+            if conf_lower in name_lower and self._matches_filters(conf, sport, division, gender):
+                return conf
+
+        return None
+
+    def _query_standings_by_year(
+        self,
+        year: int,
+        sport: Optional[str],
+        division: Optional[str],
+        gender: Optional[str],
+        conference: Optional[str] = None
+    ) -> Tuple[Standing, ...]:
+        """Cached tuple of a year's standings matching the filters"""
+        if conference:
+            conf_lower = conference.lower()
+            key = ('year', year, sport, division, gender, conf_lower)
+            standings = self._query_cache.get(key)
+            if standings is None:
+                names = self._conferences_containing(conf_lower)
+                standings = self._remember(key, tuple(
+                    s for s in self._query_standings_by_year(year, sport, division, gender)
+                    if s.conference in names
+                ))
+            return standings
+
+        if sport and division and gender:
+            return self._by_year_sdg.get((year, sport, division, gender), ())
+
+        key = ('year', year, sport, division, gender, None)
+        standings = self._query_cache.get(key)
+        if standings is None:
+            standings = self._remember(key, tuple(
+                s for s in self._by_year.get(year, [])
+                if self._matches_filters(s, sport, division, gender)
+            ))
         return standings
 
+    def iter_standings_by_year(
+        self,
+        year: int,
+        sport: Optional[str] = None,
+        division: Optional[str] = None,
+        gender: Optional[str] = None,
+        conference: Optional[str] = None
+    ) -> Iterator[Standing]:
+        """Iterate a year's standings without allocating a list, optionally filtered"""
+        return iter(self._query_standings_by_year(year, sport, division, gender, conference))
+
+    def get_standings_by_year(
+        self,
+        year: int,
+        sport: Optional[str] = None,
+        division: Optional[str] = None,
+        gender: Optional[str] = None,
+        conference: Optional[str] = None
+    ) -> List[Standing]:
+        """Get all standings for a specific year, optionally filtered by sport/division/gender/conference"""
+        return list(self._query_standings_by_year(year, sport, division, gender, conference))
+
     def get_standings_by_year_and_conference(
         self,
         year: int,
@@ -220,82 +588,68 @@ class DataLoader:
         gender: Optional[str] = None
     ) -> Optional[ConferenceStandings]:
         """Get standings for a specific year and conference"""
-        conf_lower = conference.lower()
+        matching = self._resolve_conference(conference, sport, division, gender)
+        if not matching:
+            return None
 
-        # Find matching conference name
-        matching_standing = None
-        for standing in self.standings_data:
-            if conf_lower in standing.conference.lower():
-                # Check filters
-                if sport and standing.sport != sport:
-                    continue
-                if division and standing.division != division:
-                    continue
-                if gender and standing.gender != gender:
-                    continue
-                matching_standing = standing
-                break
-
-        if not matching_standing:
+        # Constant-time check that the conference has any standings that year
+        mask = self._conf_year_mask.get((matching.name, matching.sport, matching.division, matching.gender), 0)
+        if year < YEAR_BASE or not mask >> (year - YEAR_BASE) & 1:
             return None
 
-        standings = [
-            s for s in self.standings_data
-            if s.year == year
-            and s.conference == matching_standing.conference
-            and s.sport == matching_standing.sport
-            and s.division == matching_standing.division
-            and s.gender == matching_standing.gender
-        ]
+        # Bucket is keyed on the full conference identity and already sorted by place
+        standings = list(self._by_year_conf.get(
+            (year, matching.name, matching.sport, matching.division, matching.gender), ()
+        ))
 
         if not standings:
             return None
 
-        # Sort by place
-        standings.sort(key=lambda x: x.place)
-
         return ConferenceStandings(
-            sport=matching_standing.sport,
-            division=matching_standing.division,
-            gender=matching_standing.gender,
+            sport=matching.sport,
+            division=matching.division,
+            gender=matching.gender,
             year=year,
-            conference=matching_standing.conference,
+            conference=matching.name,
             standings=standings
         )
 
     def get_conference_standings(self, conference: str) -> Dict[int, List[Standing]]:
         """Get all standings for a conference, grouped by year"""
-        conf_lower = conference.lower()
-
-        # Find matching conference name
-        matching_conf = None
-        for standing in self.standings_data:
-            if conf_lower in standing.conference.lower():
-                matching_conf = standing.conference
-                break
-
-        if not matching_conf:
+        key = ('conference', conference)
+        grouped = self._query_cache.get(key)
+        if grouped is None:
+            grouped = self._remember(key, self._group_conference_standings(conference))
+        return {year: list(standings) for year, standings in grouped.items()}
+
+    def _group_conference_standings(self, conference: str) -> Dict[int, Tuple[Standing, ...]]:
+        """Resolve a conference by partial name and group its standings by year"""
+        matching = self._resolve_conference(conference)
+        if not matching:
             return {}
+        matching_conf = matching.name
 
         result: Dict[int, List[Standing]] = {}
 
-        for standing in self.standings_data:
-            if standing.conference == matching_conf:
-                if standing.year not in result:
-                    result[standing.year] = []
-                result[standing.year].append(standing)
+        # Bucket is already sorted by (year, place)
+        for standing in self._by_conf[matching_conf]:
+            if standing.year not in result:
+                result[standing.year] = []
+            result[standing.year].append(standing)
 
-        # Sort standings within each year
-        for year in result:
-            result[year].sort(key=lambda x: x.place)
+        return {year: tuple(standings) for year, standings in result.items()}
 
-        return result
+    def get_filter_combinations(self) -> List[Tuple[str, str, str]]:
+        """Distinct (sport, division, gender) combinations present in the loaded data"""
+        combos = {(school.sport, school.division, school.gender) for school in self._schools_cache}
+        combos.update((sport, division, gender) for _, sport, division, gender in self._by_year_sdg)
+        return sorted(combos)
 
     def get_stats(self) -> Dict[str, int]:
         """Get database statistics"""
         return {
-            "total_schools": len(self.schools_data),
+            "total_schools": len(self._schools_cache),
             "total_standings": len(self.standings_data),
             "total_conferences": len(self.conferences_cache),
-            "years_covered": len(set(s.year for s in self.standings_data))
+            "years_covered": len(self._by_year)
         }
@@ -2,13 +2,18 @@
 Sports Standings API
 FastAPI application with OpenAPI/Swagger documentation
 """
-from fastapi import FastAPI, HTTPException, Query, Path
+import asyncio
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, HTTPException, Query, Path, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, StreamingResponse
-from typing import List, Optional
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
+from typing import Dict, List, NamedTuple, Optional, Tuple
 import os
 import io
 import csv
+import hashlib
+import orjson
 from pathlib import Path as FilePath
 
 from api.models import (
@@ -22,11 +27,26 @@ from api.models import (
     ErrorResponse,
     PaginatedResponse
 )
-from api.data_loader import DataLoader
+from api.data_loader import DataLoader, YEARS
 
 # API Version
 API_VERSION = "1.0.0"
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Load data and warm response caches before serving requests"""
+    print("Loading NAIA wrestling data...")
+    # Parse off the event loop so startup doesn't block it
+    if not await asyncio.to_thread(data_loader.load_data):
+        # Refuse to serve rather than answer every request with an error
+        print("✗ Failed to load data")
+        raise RuntimeError("data load failed")
+    _precompute_responses()
+    print(f"✓ Loaded {_stats['total_schools']} schools, {_stats['total_standings']} standings")
+    yield
+
+
 # Initialize FastAPI app
 app = FastAPI(
     title="Lantern BRP Athletics Data API",
@@ -61,6 +81,8 @@ app = FastAPI(
     * `/api/v1/conferences?division=naia`
     """,
     version=API_VERSION,
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
     contact={
         "name": "AthleteHub - Lantern Sports Data",
         "url": "https://api.athletehub.lanternbrp.com"
@@ -80,6 +102,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress list responses; small bodies aren't worth the CPU
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=6)
+
 # Initialize data loader
 # Determine CSV paths relative to project root
 BASE_DIR = FilePath(__file__).parent.parent
@@ -89,15 +114,98 @@ SORTED_CSV = BASE_DIR / "NAIA_Complete_Sorted.csv"
 data_loader = DataLoader(str(MAIN_CSV), str(SORTED_CSV))
 
 
-@app.on_event("startup")
-async def startup_event():
-    """Load data on startup"""
-    print("Loading NAIA wrestling data...")
-    if data_loader.load_data():
-        stats = data_loader.get_stats()
-        print(f"✓ Loaded {stats['total_schools']} schools, {stats['total_standings']} standings")
+class _CachedList(NamedTuple):
+    """A list response serialized once at startup"""
+    items: Tuple[bytes, ...]  # each element's JSON, for paginated slices
+    body: bytes  # the whole array
+    etag: str  # weak, because the gzip middleware may re-encode the body
+
+
+# Routing table of precomputed list responses, keyed by endpoint and filter
+# values. Handlers look up an entry instead of filtering and serializing.
+_response_table: Dict[tuple, _CachedList] = {}
+
+# Whole-dataset counts and per-filter /api/v1/stats bodies, fixed once loaded
+_stats: Dict[str, int] = {}
+_stats_by_filter: Dict[Tuple[str, str, str], dict] = {}
+
+_ALLOWED_YEARS = frozenset(YEARS)
+# Documents the year range in OpenAPI like ge/le would; _check_year does the validating
+_YEAR_SCHEMA = {"minimum": YEARS[0], "maximum": YEARS[-1]}
+
+# Data only changes on redeploy, so clients and proxies may reuse responses
+CACHE_CONTROL = "public, max-age=3600"
+
+
+def _precompute_responses():
+    """Serialize list responses for every sport/division/gender combination in the data"""
+    _response_table.clear()
+    _stats.clear()
+    _stats.update(data_loader.get_stats())
+    _stats_by_filter.clear()
+    for sport, division, gender in data_loader.get_filter_combinations():
+        filters = dict(sport=sport, division=division, gender=gender)
+        _stats_by_filter[(sport, division, gender)] = _filtered_stats(**filters)
+        _store_list(("schools", sport, division, gender), data_loader.get_all_schools_raw(**filters))
+        _store_list(
+            ("conferences", sport, division, gender),
+            [conf.model_dump() for conf in data_loader.get_all_conferences(**filters)]
+        )
+        for year in YEARS:
+            standings = data_loader.get_standings_by_year(year, **filters)
+            if standings:
+                _store_list(("standings", year, sport, division, gender), [s.model_dump() for s in standings])
+
+
+def _store_list(key: tuple, rows: List[dict]):
+    """Serialize rows into the response table under key"""
+    items = tuple(orjson.dumps(row) for row in rows)
+    body = b"[" + b",".join(items) + b"]"
+    _response_table[key] = _CachedList(items, body, f'W/"{hashlib.sha256(body).hexdigest()[:16]}"')
+
+
+def _filtered_stats(sport: str, division: str, gender: str) -> dict:
+    """Statistics body for one sport/division/gender combination"""
+    schools = data_loader.get_all_schools(sport=sport, division=division, gender=gender)
+    standings = [
+        s
+        for year in YEARS
+        for s in data_loader.iter_standings_by_year(year, sport=sport, division=division, gender=gender)
+    ]
+    conferences = data_loader.get_all_conferences(sport=sport, division=division, gender=gender)
+
+    years_with_data = sorted(set(s.year for s in standings))
+
+    return {
+        "sport": sport,
+        "division": division,
+        "gender": gender,
+        "total_schools": len(schools),
+        "total_standings": len(standings),
+        "total_conferences": len(conferences),
+        "years_covered": len(years_with_data),
+        "years": years_with_data
+    }
+
+
+def _check_year(year: int):
+    """Reject years outside the dataset with a set lookup instead of Path range validation"""
+    if year not in _ALLOWED_YEARS:
+        raise HTTPException(status_code=400, detail=f"Year must be between {YEARS[0]} and {YEARS[-1]}")
+
+
+def _cached_response(request: Request, entry: _CachedList, skip: int = 0, limit: Optional[int] = None) -> Response:
+    """Precomputed JSON array (or a page of it) with ETag headers, or 304 if the client's copy is current"""
+    if skip == 0 and (limit is None or limit >= len(entry.items)):
+        etag, body = entry.etag, entry.body
     else:
-        print("✗ Failed to load data")
+        etag, body = f'{entry.etag[:-1]}-{skip}-{limit}"', None
+    headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    if body is None:
+        body = b"[" + b",".join(entry.items[skip:skip + limit]) + b"]"
+    return Response(content=body, media_type="application/json", headers=headers)
 
 
 @app.get(
@@ -140,25 +248,25 @@ async def root():
 )
 async def health_check():
     """Check API health and data status"""
-    stats = data_loader.get_stats()
-
     return HealthResponse(
         status="healthy" if data_loader.loaded else "unhealthy",
         version=API_VERSION,
         data_loaded=data_loader.loaded,
-        total_schools=stats.get("total_schools", 0),
-        total_standings=stats.get("total_standings", 0)
+        total_schools=_stats.get("total_schools", 0),
+        total_standings=_stats.get("total_standings", 0)
     )
 
 
 @app.get(
     "/api/v1/schools",
-    response_model=List[School],
+    response_model=None,
+    responses={200: {"model": List[School]}},
     tags=["Schools"],
     summary="List All Schools",
     description="Get a list of all schools with their placement history"
 )
 async def get_schools(
+    request: Request,
     skip: int = Query(0, ge=0, description="Number of schools to skip"),
     limit: int = Query(100, ge=1, le=500, description="Maximum schools to return"),
     conference: Optional[str] = Query(None, description="Filter by conference name"),
@@ -167,21 +275,22 @@ async def get_schools(
     gender: str = Query("mens", description="Gender (mens, womens, coed)")
 ):
     """Get all schools with pagination and filtering by sport/division/gender"""
-    if not data_loader.loaded:
-        raise HTTPException(status_code=503, detail="Data not loaded")
-
-    schools = data_loader.get_all_schools(sport=sport, division=division, gender=gender)
-
-    # Filter by conference if specified
-    if conference:
-        conf_lower = conference.lower()
-        schools = [s for s in schools if conf_lower in s.conference.lower()]
+    if not conference:
+        entry = _response_table.get(("schools", sport, division, gender))
+        if entry is not None:
+            return _cached_response(request, entry, skip, limit)
+
+    # Plain dicts skip the model-to-JSON walk; orjson encodes them directly.
+    # The loader memoizes each filter combination, including the conference filter.
+    schools = data_loader.get_all_schools_raw(
+        sport=sport, division=division, gender=gender, conference=conference
+    )
 
     # Pagination
     total = len(schools)
     schools = schools[skip:skip + limit]
 
-    return schools
+    return ORJSONResponse(schools)
 
 
 @app.get(
@@ -199,9 +308,6 @@ async def get_school(
     gender: str = Query("mens", description="Gender (mens, womens, coed)")
 ):
     """Get a specific school by name filtered by sport/division/gender"""
-    if not data_loader.loaded:
-        raise HTTPException(status_code=503, detail="Data not loaded")
-
     school = data_loader.get_school_by_name(school_name, sport=sport, division=division, gender=gender)
 
     if not school:
@@ -215,19 +321,22 @@ async def get_school(
 
 @app.get(
     "/api/v1/conferences",
-    response_model=List[Conference],
+    response_model=None,
+    responses={200: {"model": List[Conference]}},
     tags=["Conferences"],
     summary="List All Conferences",
     description="Get a list of all conferences with their schools and active years"
 )
 async def get_conferences(
+    request: Request,
     sport: str = Query("wrestling", description="Sport (wrestling, basketball, soccer, etc)"),
     division: str = Query("naia", description="Division (naia, ncaa-d1, ncaa-d2, ncaa-d3)"),
     gender: str = Query("mens", description="Gender (mens, womens, coed)")
 ):
     """Get all conferences filtered by sport/division/gender"""
-    if not data_loader.loaded:
-        raise HTTPException(status_code=503, detail="Data not loaded")
+    entry = _response_table.get(("conferences", sport, division, gender))
+    if entry is not None:
+        return _cached_response(request, entry)
 
     return data_loader.get_all_conferences(sport=sport, division=division, gender=gender)
 
@@ -247,9 +356,6 @@ async def get_conference(
     gender: str = Query("mens", description="Gender (mens, womens, coed)")
 ):
     """Get a specific conference by name filtered by sport/division/gender"""
-    if not data_loader.loaded:
-        raise HTTPException(status_code=503, detail="Data not loaded")
-
     conference = data_loader.get_conference_by_name(conference_name)
 
     if not conference:
@@ -271,11 +377,11 @@ async def get_conference(
 
 @app.get(
     "/api/v1/conferences/{conference_name}/standings",
-    response_model=dict,
+    response_model=None,
     tags=["Conferences"],
     summary="Get Conference Standings",
     description="Get all standings for a conference, grouped by year",
-    responses={404: {"model": ErrorResponse}}
+    responses={200: {"model": dict}, 404: {"model": ErrorResponse}}
 )
 async def get_conference_standings(
     conference_name: str = Path(..., description="Conference name (case-insensitive partial match)"),
@@ -284,9 +390,6 @@ async def get_conference_standings(
     gender: str = Query("mens", description="Gender (mens, womens, coed)")
 ):
     """Get all standings for a conference filtered by sport/division/gender"""
-    if not data_loader.loaded:
-        raise HTTPException(status_code=503, detail="Data not loaded")
-
     standings = data_loader.get_conference_standings(conference_name)
 
     if not standings:
@@ -295,7 +398,8 @@ async def get_conference_standings(
             detail=f"Conference not found: {conference_name}"
         )
 
-    # Filter standings by sport/division/gender
+    # Filter standings by sport/division/gender; interned values compare by identity
+    sport, division, gender = data_loader.intern(sport), data_loader.intern(division), data_loader.intern(gender)
     filtered_standings = {}
     for year, year_standings in standings.items():
         filtered = [
@@ -316,28 +420,31 @@ async def get_conference_standings(
 
 @app.get(
     "/api/v1/standings/{year}",
-    response_model=List[Standing],
+    response_model=None,
+    responses={200: {"model": List[Standing]}},
     tags=["Standings"],
     summary="Get Standings by Year",
     description="Get all conference standings for a specific year"
 )
 async def get_standings_by_year(
-    year: int = Path(..., ge=2020, le=2025, description="Year (2020-2025)"),
+    request: Request,
+    year: int = Path(..., description="Year (2020-2025)", json_schema_extra=_YEAR_SCHEMA),
     conference: Optional[str] = Query(None, description="Filter by conference name"),
     sport: str = Query("wrestling", description="Sport (wrestling, basketball, soccer, etc)"),
     division: str = Query("naia", description="Division (naia, ncaa-d1, ncaa-d2, ncaa-d3)"),
     gender: str = Query("mens", description="Gender (mens, womens, coed)")
 ):
     """Get all standings for a specific year filtered by sport/division/gender"""
-    if not data_loader.loaded:
-        raise HTTPException(status_code=503, detail="Data not loaded")
+    _check_year(year)
 
-    standings = data_loader.get_standings_by_year(year, sport=sport, division=division, gender=gender)
+    if not conference:
+        entry = _response_table.get(("standings", year, sport, division, gender))
+        if entry is not None:
+            return _cached_response(request, entry)
 
-    # Filter by conference if specified
-    if conference:
-        conf_lower = conference.lower()
-        standings = [s for s in standings if conf_lower in s.conference.lower()]
+    standings = data_loader.get_standings_by_year(
+        year, sport=sport, division=division, gender=gender, conference=conference
+    )
 
     if not standings:
         raise HTTPException(
@@ -357,15 +464,14 @@ async def get_standings_by_year(
     responses={404: {"model": ErrorResponse}}
 )
 async def get_standings_by_year_and_conference(
-    year: int = Path(..., ge=2020, le=2025, description="Year (2020-2025)"),
+    year: int = Path(..., description="Year (2020-2025)", json_schema_extra=_YEAR_SCHEMA),
     conference_name: str = Path(..., description="Conference name (case-insensitive partial match)"),
     sport: str = Query("wrestling", description="Sport (wrestling, basketball, soccer, etc)"),
     division: str = Query("naia", description="Division (naia, ncaa-d1, ncaa-d2, ncaa-d3)"),
     gender: str = Query("mens", description="Gender (mens, womens, coed)")
 ):
     """Get standings for a specific year and conference filtered by sport/division/gender"""
-    if not data_loader.loaded:
-        raise HTTPException(status_code=503, detail="Data not loaded")
+    _check_year(year)
 
     standings = data_loader.get_standings_by_year_and_conference(
         year, conference_name, sport=sport, division=division, gender=gender
@@ -392,28 +498,10 @@ async def get_stats(
     gender: str = Query("mens", description="Gender (mens, womens, coed)")
 ):
     """Get database statistics filtered by sport/division/gender"""
-    if not data_loader.loaded:
-        raise HTTPException(status_code=503, detail="Data not loaded")
-
-    # Get filtered data
-    schools = data_loader.get_all_schools(sport=sport, division=division, gender=gender)
-    standings = data_loader.get_standings_by_year(2020, sport=sport, division=division, gender=gender)
-    for year in [2021, 2022, 2023, 2024, 2025]:
-        standings.extend(data_loader.get_standings_by_year(year, sport=sport, division=division, gender=gender))
-    conferences = data_loader.get_all_conferences(sport=sport, division=division, gender=gender)
-
-    years_with_data = sorted(set(s.year for s in standings))
-
-    return {
-        "sport": sport,
-        "division": division,
-        "gender": gender,
-        "total_schools": len(schools),
-        "total_standings": len(standings),
-        "total_conferences": len(conferences),
-        "years_covered": len(years_with_data),
-        "years": years_with_data
-    }
+    stats = _stats_by_filter.get((sport, division, gender))
+    if stats is None:
+        stats = _filtered_stats(sport, division, gender)
+    return stats
 
 
 @app.get(
@@ -429,9 +517,6 @@ async def export_csv(
     format: str = Query("sorted", description="CSV format: 'sorted' (by year/conference/place) or 'main' (by school with year columns)")
 ):
     """Export standings data as downloadable CSV file"""
-    if not data_loader.loaded:
-        raise HTTPException(status_code=503, detail="Data not loaded")
-
     output = io.StringIO()
 
     if format == "sorted":
@@ -440,10 +525,11 @@ async def export_csv(
         writer.writerow(['Sport', 'Division', 'Gender', 'Year', 'Conference', 'Place', 'School'])
 
         # Get all standings for last 5 years (2020-2025)
-        all_standings = []
-        for year in [2020, 2021, 2022, 2023, 2024, 2025]:
-            year_standings = data_loader.get_standings_by_year(year, sport=sport, division=division, gender=gender)
-            all_standings.extend(year_standings)
+        all_standings = [
+            s
+            for year in [2020, 2021, 2022, 2023, 2024, 2025]
+            for s in data_loader.iter_standings_by_year(year, sport=sport, division=division, gender=gender)
+        ]
 
         # Sort by year, conference, place
         all_standings.sort(key=lambda s: (s.year, s.conference, s.place))
@@ -470,11 +556,8 @@ async def export_csv(
             '2024 Conference Team Place', '2025 Conference Team Place'
         ])
 
-        # Get all schools
-        schools = data_loader.get_all_schools(sport=sport, division=division, gender=gender)
-
         # Write data
-        for school in schools:
+        for school in data_loader.iter_all_schools(sport=sport, division=division, gender=gender):
             # Create dict of year -> place
             placements_by_year = {p.year: p.place for p in school.placements}
 
@@ -506,7 +589,7 @@ async def export_csv(
 # Exception handlers
 @app.exception_handler(404)
 async def not_found_handler(request, exc):
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=404,
         content={"error": "Not Found", "detail": str(exc.detail)}
     )
@@ -514,7 +597,7 @@ async def not_found_handler(request, exc):
 
 @app.exception_handler(500)
 async def internal_error_handler(request, exc):
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={"error": "Internal Server Error", "detail": "An unexpected error occurred"}
     )
@@ -522,4 +605,14 @@ async def internal_error_handler(request, exc):
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8080)
+    # Workers need an import string; each worker loads its own copy of the data
+    uvicorn.run(
+        "api.main:app",
+        host="0.0.0.0",
+        port=8080,
+        loop="uvloop",
+        http="httptools",
+        workers=int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 1)),
+        log_level="warning",
+        access_log=False
+    )
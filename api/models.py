@@ -2,7 +2,10 @@
 Pydantic models for NAIA Wrestling API
 """
 from typing import Optional, List, Dict
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+# Models with defer_build=True are not served by any route yet, so their
+# schemas are built on first use instead of at import
 
 
 class SchoolPlacement(BaseModel):
@@ -14,6 +17,8 @@ class SchoolPlacement(BaseModel):
     place: int = Field(..., description="Conference placement (1-10+)")
     conference: str = Field(..., description="Conference name")
 
+    model_config = ConfigDict(frozen=True)
+
 
 class School(BaseModel):
     """School entity with all placements"""
@@ -24,8 +29,9 @@ class School(BaseModel):
     conference: str = Field(..., description="Primary conference")
     placements: List[SchoolPlacement] = Field(default=[], description="All year placements")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        frozen=True,
+        json_schema_extra={
             "example": {
                 "name": "Grand View (Iowa) - Mens",
                 "sport": "wrestling",
@@ -38,6 +44,7 @@ class School(BaseModel):
                 ]
             }
         }
+    )
 
 
 class Standing(BaseModel):
@@ -50,8 +57,9 @@ class Standing(BaseModel):
     place: int = Field(..., description="Placement")
     school: str = Field(..., description="School name")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        frozen=True,
+        json_schema_extra={
             "example": {
                 "sport": "wrestling",
                 "division": "naia",
@@ -62,6 +70,7 @@ class Standing(BaseModel):
                 "school": "Grand View (Iowa) - Mens"
             }
         }
+    )
 
 
 class Conference(BaseModel):
@@ -73,8 +82,9 @@ class Conference(BaseModel):
     schools: List[str] = Field(default=[], description="Schools in conference")
     years_active: List[int] = Field(default=[], description="Years with data")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        frozen=True,
+        json_schema_extra={
             "example": {
                 "name": "Heart of America Athletic Conference",
                 "sport": "wrestling",
@@ -84,6 +94,7 @@ class Conference(BaseModel):
                 "years_active": [2020, 2021, 2022, 2023, 2024, 2025]
             }
         }
+    )
 
 
 class ConferenceStandings(BaseModel):
@@ -95,8 +106,9 @@ class ConferenceStandings(BaseModel):
     conference: str = Field(..., description="Conference name")
     standings: List[Standing] = Field(..., description="Ordered standings")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        frozen=True,
+        json_schema_extra={
             "example": {
                 "sport": "wrestling",
                 "division": "naia",
@@ -109,6 +121,7 @@ class ConferenceStandings(BaseModel):
                 ]
             }
         }
+    )
 
 
 class ScrapeRequest(BaseModel):
@@ -117,14 +130,16 @@ class ScrapeRequest(BaseModel):
     year: int = Field(..., ge=2020, le=2030, description="Year to scrape for")
     force: bool = Field(default=False, description="Force re-scrape if URL already processed")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        defer_build=True,
+        json_schema_extra={
             "example": {
                 "url": "https://www.naia.org/sports/mwrest/2025-26/Releases/Conf_3",
                 "year": 2025,
                 "force": False
             }
         }
+    )
 
 
 class ScrapeResult(BaseModel):
@@ -138,8 +153,9 @@ class ScrapeResult(BaseModel):
     message: str = Field(default="", description="Status message")
     errors: List[str] = Field(default=[], description="Any errors encountered")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        defer_build=True,
+        json_schema_extra={
             "example": {
                 "success": True,
                 "url": "https://www.naia.org/sports/mwrest/2025-26/Releases/Conf_3",
@@ -151,6 +167,7 @@ class ScrapeResult(BaseModel):
                 "errors": []
             }
         }
+    )
 
 
 class HealthResponse(BaseModel):
@@ -161,8 +178,8 @@ class HealthResponse(BaseModel):
     total_schools: int = Field(default=0, description="Total schools in database")
     total_standings: int = Field(default=0, description="Total standing entries")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "status": "healthy",
                 "version": "1.0.0",
@@ -171,6 +188,7 @@ class HealthResponse(BaseModel):
                 "total_standings": 376
             }
         }
+    )
 
 
 class ErrorResponse(BaseModel):
@@ -178,13 +196,14 @@ class ErrorResponse(BaseModel):
     error: str = Field(..., description="Error message")
     detail: Optional[str] = Field(None, description="Detailed error information")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "error": "School not found",
                 "detail": "No school found with name 'Invalid School'"
             }
         }
+    )
 
 
 class PaginatedResponse(BaseModel):
@@ -195,8 +214,9 @@ class PaginatedResponse(BaseModel):
     total_pages: int = Field(..., description="Total pages")
     items: List[dict] = Field(..., description="Items for current page")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        defer_build=True,
+        json_schema_extra={
             "example": {
                 "total": 152,
                 "page": 1,
@@ -205,3 +225,4 @@ class PaginatedResponse(BaseModel):
                 "items": []
             }
         }
+    )
@@ -2,9 +2,13 @@
 CSV parsing and creation module.
 """
 import csv
-from typing import List, Dict, Any, Optional
+from operator import itemgetter
+from typing import List, Dict, Any, Optional, Tuple
 from pathlib import Path
 
+# Large enough that a whole results CSV goes out in one or two write() calls
+WRITE_BUFFER_SIZE = 1 << 20
+
 
 class CSVHandler:
     """A class for reading, writing, and manipulating CSV files."""
@@ -42,11 +46,31 @@ class CSVHandler:
             print(f"Error reading CSV: {e}")
             return data
 
+    @staticmethod
+    def read_csv_indexed(file_path: str) -> Tuple[Dict[str, int], List[List[str]]]:
+        """
+        Read CSV file and return a header index with plain list rows.
+
+        Cheaper than read_csv_as_dicts: one dict for the whole file instead of
+        one per row. Access a cell with row[index['School']].
+
+        Args:
+            file_path: Path to the CSV file
+
+        Returns:
+            Tuple of (column name -> position, rows)
+        """
+        data = CSVHandler.read_csv(file_path)
+        index = {name: i for i, name in enumerate(data['headers'])}
+        return index, data['rows']
+
     @staticmethod
     def read_csv_as_dicts(file_path: str) -> List[Dict[str, str]]:
         """
         Read CSV file and return rows as dictionaries.
 
+        Prefer read_csv_indexed when the caller only needs a few columns.
+
         Args:
             file_path: Path to the CSV file
 
@@ -84,7 +108,7 @@ class CSVHandler:
             True if successful, False otherwise
         """
         try:
-            with open(file_path, mode, encoding='utf-8', newline='') as f:
+            with open(file_path, mode, encoding='utf-8', newline='', buffering=WRITE_BUFFER_SIZE) as f:
                 writer = csv.writer(f)
 
                 if mode == 'w' and headers:
@@ -123,7 +147,7 @@ class CSVHandler:
             fieldnames = list(rows[0].keys())
 
         try:
-            with open(file_path, mode, encoding='utf-8', newline='') as f:
+            with open(file_path, mode, encoding='utf-8', newline='', buffering=WRITE_BUFFER_SIZE) as f:
                 writer = csv.DictWriter(f, fieldnames=fieldnames)
 
                 if mode == 'w':
@@ -172,7 +196,12 @@ class CSVHandler:
         Returns:
             Filtered list of rows
         """
-        return [row for row in rows if row.get(column) == value]
+        getter = itemgetter(column)
+        try:
+            return [row for row in rows if getter(row) == value]
+        except KeyError:
+            # Some rows lack the column; treat it as missing like dict.get
+            return [row for row in rows if row.get(column) == value]
 
     @staticmethod
     def sort_rows(rows: List[Dict[str, Any]], column: str, reverse: bool = False) -> List[Dict[str, Any]]:
@@ -187,4 +216,8 @@ class CSVHandler:
         Returns:
             Sorted list of rows
         """
-        return sorted(rows, key=lambda x: x.get(column, ''), reverse=reverse)
+        try:
+            return sorted(rows, key=itemgetter(column), reverse=reverse)
+        except KeyError:
+            # Some rows lack the column; sort those as empty strings
+            return sorted(rows, key=lambda x: x.get(column, ''), reverse=reverse)
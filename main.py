@@ -2,9 +2,9 @@
 Main application entry point for web scraping and CSV handling.
 """
 import os
-from web_parser import WebParser
+from web_parser import WebParser, TABLES_AND_LINKS
 from csv_handler import CSVHandler
-from naia_scraper import NAIAScraper
+from naia_scraper import NAIAScraper, year_from_url
 
 
 def example_web_scraping():
@@ -16,7 +16,7 @@ def example_web_scraping():
 
     # Example: Scrape a webpage
     url = "https://example.com"  # Replace with your target URL
-    soup = parser.get_soup(url)
+    soup = parser.get_soup(url, parse_only=TABLES_AND_LINKS)
 
     if soup:
         # Extract tables
@@ -38,23 +38,22 @@ def example_csv_operations():
 
     # Read existing CSV
     csv_file = "NAIA_blank - NAIA_results.csv"
-    data = handler.read_csv_as_dicts(csv_file)
+    columns, rows = handler.read_csv_indexed(csv_file)
 
-    if data:
-        print(f"Loaded {len(data)} rows")
-        if data:
-            print(f"Columns: {list(data[0].keys())}")
+    if rows:
+        print(f"Loaded {len(rows)} rows")
+        print(f"Columns: {list(columns)}")
 
     # Create new CSV
     new_file = "output.csv"
     headers = ["Name", "Rank", "Score"]
-    rows = [
+    new_rows = [
         ["John Doe", "1", "95"],
         ["Jane Smith", "2", "92"],
         ["Bob Johnson", "3", "88"]
     ]
 
-    handler.write_csv(new_file, headers, rows)
+    handler.write_csv(new_file, headers, new_rows)
 
 
 def example_scrape_to_csv():
@@ -66,7 +65,7 @@ def example_scrape_to_csv():
 
     # Scrape website
     url = "https://example.com"  # Replace with your target URL
-    soup = parser.get_soup(url)
+    soup = parser.get_soup(url, parse_only=TABLES_AND_LINKS)
 
     if soup:
         # Extract table data
@@ -83,59 +82,85 @@ def example_scrape_to_csv():
             print(f"Saved {len(rows)} rows to {output_file}")
 
 
+def prompt_year(url: str):
+    """Ask for the standings year of a URL whose season can't be read from it."""
+    print("\nWhich year are you scraping? (2020-2025)")
+    print(f"URL: {url}")
+    year_input = input("Year: ").strip()
+
+    try:
+        return int(year_input)
+    except ValueError:
+        print("Invalid year")
+        return None
+
+
 def scrape_naia_wrestling():
     """Scrape NAIA wrestling standings and update CSV."""
     print("\n=== NAIA Wrestling Standings Scraper ===")
 
     scraper = NAIAScraper()
 
-    # Check for start URL from .env
-    start_url = os.getenv('NAIA_START_URL')
+    # Check for start URLs from .env; NAIA_START_URLS takes a comma-separated batch
+    start_urls = [url.strip() for url in os.getenv('NAIA_START_URLS', '').split(',') if url.strip()]
+    if not start_urls and os.getenv('NAIA_START_URL'):
+        start_urls = [os.getenv('NAIA_START_URL')]
 
-    if not start_url:
-        print("\nERROR: Please add NAIA_START_URL to your .env file")
+    if not start_urls:
+        print("\nERROR: Please add NAIA_START_URL (or NAIA_START_URLS) to your .env file")
         print("Example: NAIA_START_URL=https://example.com/standings/2024")
         return
 
-    print(f"Start URL: {start_url}")
-
-    # Check if URL was already processed
-    if scraper.is_url_processed(start_url):
-        print(f"\nURL already processed: {start_url}")
+    for start_url in start_urls:
+        print(f"Start URL: {start_url}")
+
+    # Check if URLs were already processed, reporting each one that is skipped
+    pending = []
+    for start_url in start_urls:
+        if scraper.is_url_processed(start_url):
+            print(f"\nURL already processed, skipping: {start_url}")
+        else:
+            pending.append(start_url)
+    if not pending:
         print("Skipping to avoid duplicate scraping.")
         print("\nProcessed URLs:")
         for url in scraper.get_processed_urls():
             print(f"  - {url}")
         return
 
-    # Prompt for year (or extract from URL)
-    print("\nWhich year are you scraping? (2020-2025)")
-    year_input = input("Year: ").strip()
-
-    try:
-        year = int(year_input)
+    # Take the year from the URL's season, prompting only when it isn't there
+    urls_by_year = {}
+    for url in pending:
+        year = year_from_url(url)
+        if year is None:
+            year = prompt_year(url)
+            if year is None:
+                return
         if year < 2020 or year > 2025:
             print("Year must be between 2020 and 2025")
             return
-    except ValueError:
-        print("Invalid year")
-        return
-
-    # Scrape the standings
-    result = scraper.scrape_standings(start_url, year)
-
-    if result['status'] == 'success':
-        print(f"\nSuccessfully scraped {len(result['data'])} standings")
-
-        # Update CSV with the data
-        scraper.update_csv_with_standings(result['data'], year)
-        print(f"\nCSV updated with {year} standings")
-
+        urls_by_year.setdefault(year, []).append(url)
+
+    # Scrape the standings, fetching each year's pages concurrently
+    scraped = False
+    for year, urls in sorted(urls_by_year.items()):
+        for result in scraper.scrape_many(urls, year):
+            if result['status'] == 'success':
+                print(f"\nSuccessfully scraped {len(result['data'])} standings")
+
+                # Update CSV with the data; the URL is only recorded once that succeeds
+                if scraper.apply_scrape_result(result):
+                    print(f"\nCSV updated with {year} standings")
+                    scraped = True
+                else:
+                    print(f"\nCould not update CSV from {result['url']}; it will be retried next run")
+            else:
+                print(f"\nFailed to scrape {result['url']}: {result.get('reason', 'unknown error')}")
+
+    if scraped:
         print("\nNext steps:")
         print("1. Update NAIA_START_URL in .env with next URL to scrape")
         print("2. Run the script again to scrape the next year/conference")
-    else:
-        print(f"\nFailed to scrape: {result.get('reason', 'unknown error')}")
 
 
 def view_processed_urls():
@@ -1,15 +1,113 @@
 """
 NAIA Wrestling Standings Scraper module.
 """
+import hashlib
 import os
-import json
 import re
-from typing import Dict, List, Optional, Set
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 from pathlib import Path
+import orjson
 from dotenv import load_dotenv
 from web_parser import WebParser
 from csv_handler import CSVHandler
 
+# Read .env once per process instead of on every NAIAScraper()
+load_dotenv()
+
+# Standings text patterns, compiled once at import
+_RE_HAS_RANK = re.compile(r'^\d+\.\s+\w+')
+_RE_SPLIT_RANK = re.compile(r'\d+\.\s+')
+_RE_SCHOOL_SCORE = re.compile(r'^(.+?)\s*-\s*(\d+\.?\d*)$')
+_RE_SPLIT_SCORE = re.compile(r'(\d+\.?\d*)')
+_RE_DIGIT_UPPER = re.compile(r'(\d)\s+([A-Z])')
+_RE_ENTRY = re.compile(r'^(.+?)\s+(\d{2,4})$')
+# Passed to BeautifulSoup as a string filter so matching runs in the C regex engine
+_RE_CONFERENCE = re.compile('Conference')
+# Season segment of NAIA URLs; /2024-25/ holds the 2024 standings
+_RE_SEASON = re.compile(r'/(\d{4})-\d{2}/')
+
+
+def year_from_url(url: str) -> Optional[int]:
+    """
+    Derive the standings year from a NAIA season URL.
+
+    Args:
+        url: URL such as https://www.naia.org/sports/mwrest/2024-25/Releases/6_Conference
+
+    Returns:
+        First year of the season, or None if the URL has no season segment
+    """
+    match = _RE_SEASON.search(url)
+    return int(match.group(1)) if match else None
+
+
+def _file_stamp(path: str) -> Tuple[int, int]:
+    """(mtime_ns, size) of a file, used to invalidate the parsed-file caches below."""
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+@lru_cache(maxsize=8)
+def _read_school_data(csv_file: str, stamp: Tuple[int, int]) -> Tuple[Dict[str, str], ...]:
+    """Parsed school CSV rows; cached until the file's stamp changes."""
+    return tuple(CSVHandler.read_csv_as_dicts(csv_file))
+
+
+@lru_cache(maxsize=8)
+def _read_processed_log(log_file: str, stamp: Tuple[int, int]) -> Tuple[Dict[str, Dict], int]:
+    """Latest log entry per URL and line count of the log; cached until the file's stamp changes."""
+    entries = {}
+    lines = 0
+    skipped = 0
+    with open(log_file, 'rb') as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                lines += 1
+                # A crash mid-append can leave a torn line; lose that entry, not the whole log
+                try:
+                    entry = orjson.loads(line)
+                    entries[entry['url']] = entry
+                except (orjson.JSONDecodeError, KeyError, TypeError):
+                    skipped += 1
+    if skipped:
+        print(f"Warning: skipped {skipped} unreadable line(s) in {log_file}")
+    return entries, lines
+
+
+def read_processed_urls(log_file: str = "processed_urls.jsonl") -> List[str]:
+    """
+    List the URLs in a processed URL log without creating a scraper.
+
+    Uses the same reader as NAIAScraper, so torn or unreadable lines are skipped.
+
+    Args:
+        log_file: Path to the processed URL log
+
+    Returns:
+        Processed URLs, or an empty list if the log does not exist
+    """
+    if not os.path.exists(log_file):
+        return []
+    entries, _ = _read_processed_log(log_file, _file_stamp(log_file))
+    return list(entries)
+
+
+def standings_fingerprint(standings: List[Dict[str, str]]) -> str:
+    """
+    Short hash identifying a set of scraped standings.
+
+    Args:
+        standings: Standings as returned by _extract_standings
+
+    Returns:
+        16-character hex digest
+    """
+    return hashlib.blake2b(orjson.dumps(standings, option=orjson.OPT_SORT_KEYS), digest_size=8).hexdigest()
+
 
 class NAIAScraper:
     """A class for scraping NAIA wrestling standings data."""
@@ -21,35 +119,91 @@ class NAIAScraper:
         Args:
             csv_file: Path to the CSV file containing school data
         """
-        load_dotenv()
         self.csv_file = csv_file
         self.parser = WebParser()
         self.csv_handler = CSVHandler()
-        self.processed_urls_file = "processed_urls.json"
+        # Append-only log, one JSON object per processed URL
+        self.processed_urls_file = "processed_urls.jsonl"
+        # Older runs rewrote the whole set into one JSON document
+        self.legacy_processed_urls_file = "processed_urls.json"
+        self._processed_log_lines = 0
+        # URL -> latest log entry: {'url', 'year', 'fingerprint', 'ts'}
         self.processed_urls = self._load_processed_urls()
 
-    def _load_processed_urls(self) -> Set[str]:
+        # Duplicate lines only pile up when URLs are re-scraped or several scrapers share the log
+        if self._processed_log_lines > 2 * len(self.processed_urls):
+            self.compact_processed_urls()
+
+    def _load_processed_urls(self) -> Dict[str, Dict]:
         """
-        Load the set of already processed URLs from file.
+        Load already processed URLs from file.
+
+        Migrates the legacy processed_urls.json into the line log on first use.
 
         Returns:
-            Set of processed URLs
-        """
-        if os.path.exists(self.processed_urls_file):
-            try:
-                with open(self.processed_urls_file, 'r') as f:
-                    data = json.load(f)
-                    return set(data.get('urls', []))
-            except Exception as e:
-                print(f"Error loading processed URLs: {e}")
-                return set()
-        return set()
-
-    def _save_processed_urls(self):
-        """Save the set of processed URLs to file."""
+            Dictionary mapping each processed URL to its latest log entry
+        """
+        if not os.path.exists(self.processed_urls_file):
+            if os.path.exists(self.legacy_processed_urls_file):
+                return self._migrate_legacy_processed_urls()
+            return {}
+
+        try:
+            entries, lines = _read_processed_log(self.processed_urls_file, _file_stamp(self.processed_urls_file))
+            self._processed_log_lines = lines
+            return dict(entries)
+        except Exception as e:
+            print(f"Error loading processed URLs: {e}")
+            return {}
+
+    def _migrate_legacy_processed_urls(self) -> Dict[str, Dict]:
+        """
+        Convert processed_urls.json into the line log.
+
+        Returns:
+            Processed URLs from the legacy file, without year or fingerprint
+        """
+        try:
+            with open(self.legacy_processed_urls_file, 'rb') as f:
+                urls = orjson.loads(f.read()).get('urls', [])
+        except Exception as e:
+            print(f"Error loading processed URLs: {e}")
+            return {}
+
+        self.processed_urls = {url: {'url': url} for url in urls}
+        self.compact_processed_urls()
+        print(f"Migrated {len(self.processed_urls)} processed URLs to {self.processed_urls_file}")
+        return self.processed_urls
+
+    def _append_processed_url(self, entry: Dict):
+        """
+        Append one entry to the processed URL log.
+
+        Args:
+            entry: Log entry with at least a 'url' key
+        """
+        record = orjson.dumps(entry) + b'\n'
+        try:
+            with open(self.processed_urls_file, 'a+b') as f:
+                if f.seek(0, os.SEEK_END):
+                    f.seek(-1, os.SEEK_END)
+                    if f.read(1) != b'\n':
+                        # Start on a fresh line rather than gluing onto a torn one
+                        record = b'\n' + record
+                f.write(record)
+            self._processed_log_lines += 1
+        except Exception as e:
+            print(f"Error saving processed URL: {e}")
+
+    def compact_processed_urls(self):
+        """Rewrite the processed URL log with one line per URL."""
+        tmp_file = f"{self.processed_urls_file}.tmp"
         try:
-            with open(self.processed_urls_file, 'w') as f:
-                json.dump({'urls': list(self.processed_urls)}, f, indent=2)
+            with open(tmp_file, 'wb') as f:
+                for url in sorted(self.processed_urls):
+                    f.write(orjson.dumps(self.processed_urls[url]) + b'\n')
+            os.replace(tmp_file, self.processed_urls_file)
+            self._processed_log_lines = len(self.processed_urls)
             print(f"Saved {len(self.processed_urls)} processed URLs")
         except Exception as e:
             print(f"Error saving processed URLs: {e}")
@@ -66,15 +220,21 @@ class NAIAScraper:
         """
         return url in self.processed_urls
 
-    def mark_url_processed(self, url: str):
+    def mark_url_processed(self, url: str, year: Optional[int] = None, fingerprint: Optional[str] = None):
         """
         Mark a URL as processed.
 
         Args:
             url: URL to mark as processed
+            year: Year the URL was scraped for
+            fingerprint: standings_fingerprint() of what the page yielded
         """
-        self.processed_urls.add(url)
-        self._save_processed_urls()
+        previous = self.processed_urls.get(url)
+        if previous is not None and previous.get('fingerprint') == fingerprint and previous.get('year') == year:
+            return
+        entry = {'url': url, 'year': year, 'fingerprint': fingerprint, 'ts': int(time.time())}
+        self.processed_urls[url] = entry
+        self._append_processed_url(entry)
 
     def get_school_data(self) -> List[Dict[str, str]]:
         """
@@ -83,45 +243,128 @@ class NAIAScraper:
         Returns:
             List of dictionaries containing school information
         """
-        data = self.csv_handler.read_csv_as_dicts(self.csv_file)
-        return data
+        if not os.path.exists(self.csv_file):
+            return self.csv_handler.read_csv_as_dicts(self.csv_file)
+
+        # Copies, so callers can't alter the cached rows
+        return [dict(row) for row in _read_school_data(self.csv_file, _file_stamp(self.csv_file))]
 
-    def scrape_standings(self, url: str, year: int) -> Dict[str, any]:
+    def scrape_standings(self, url: str, year: int, force: bool = False) -> Dict[str, any]:
         """
         Scrape wrestling standings from a given URL for a specific year.
 
         Args:
             url: URL to scrape
             year: Year of the standings (2020-2025)
+            force: Re-scrape a processed URL; returns status 'unchanged' if the
+                page still yields the same standings for that year
 
         Returns:
             Dictionary with scraped data
         """
         # Check if URL already processed
-        if self.is_url_processed(url):
+        if not force and self.is_url_processed(url):
             print(f"URL already processed: {url}")
             return {'status': 'skipped', 'url': url, 'reason': 'already_processed'}
 
         print(f"Scraping standings for {year} from: {url}")
 
-        soup = self.parser.get_soup(url)
-        if not soup:
+        return self._scrape_page(url, year, self.parser.fetch_page(url))
+
+    def scrape_many(self, urls: List[str], year: int, max_workers: int = 8,
+                    force: bool = False) -> List[Dict[str, any]]:
+        """
+        Scrape standings from several URLs for the same year, fetching pages concurrently.
+
+        Pages are downloaded on a thread pool so network round trips overlap; parsing
+        and bookkeeping stay on the calling thread, in URL order.
+
+        Args:
+            urls: URLs to scrape
+            year: Year of the standings (2020-2025)
+            max_workers: Maximum number of pages fetched at once
+            force: Re-scrape processed URLs, as in scrape_standings
+
+        Returns:
+            List of result dictionaries, one per unique URL, in input order
+        """
+        unique_urls = list(dict.fromkeys(urls))
+        results = {}
+        pending = []
+        for url in unique_urls:
+            if not force and self.is_url_processed(url):
+                print(f"URL already processed: {url}")
+                results[url] = {'status': 'skipped', 'url': url, 'reason': 'already_processed'}
+            else:
+                pending.append(url)
+
+        if pending:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(pending))) as pool:
+                # map yields in order, so early pages are parsed while later ones download
+                for url, html in zip(pending, pool.map(self.parser.fetch_page, pending)):
+                    print(f"Scraping standings for {year} from: {url}")
+                    results[url] = self._scrape_page(url, year, html)
+
+        return [results[url] for url in unique_urls]
+
+    def _scrape_page(self, url: str, year: int, html: Optional[str]) -> Dict[str, any]:
+        """
+        Extract standings from a fetched page.
+
+        The URL is not marked as processed here; pass the result to
+        apply_scrape_result once the standings have made it into the CSV.
+
+        Args:
+            url: URL the page was fetched from
+            year: Year of the standings
+            html: Page HTML, or None if the fetch failed
+
+        Returns:
+            Dictionary with scraped data
+        """
+        if not html:
             print(f"Failed to fetch page: {url}")
             return {'status': 'failed', 'url': url, 'reason': 'fetch_failed'}
 
+        soup = self.parser.parse_html(html)
+
         # Extract standings data
         standings_data = self._extract_standings(soup, year)
+        fingerprint = standings_fingerprint(standings_data)
 
-        # Mark URL as processed
-        self.mark_url_processed(url)
+        # A forced re-scrape that found nothing new leaves the CSV alone
+        previous = self.processed_urls.get(url)
+        if previous and previous.get('year') == year and previous.get('fingerprint') == fingerprint:
+            print(f"Standings unchanged since last scrape: {url}")
+            return {'status': 'unchanged', 'url': url, 'year': year, 'reason': 'unchanged'}
 
         return {
             'status': 'success',
             'url': url,
             'year': year,
-            'data': standings_data
+            'data': standings_data,
+            'fingerprint': fingerprint
         }
 
+    def apply_scrape_result(self, result: Dict[str, any]) -> bool:
+        """
+        Write a successful scrape into the CSV, then mark its URL as processed.
+
+        The URL and fingerprint are only recorded once the CSV update succeeds, so a
+        failed update is retried by the next (forced) scrape instead of being
+        reported as unchanged.
+
+        Args:
+            result: A 'success' result from scrape_standings or scrape_many
+
+        Returns:
+            True if the CSV holds the standings and the URL was recorded
+        """
+        if not self.update_csv_with_standings(result['data'], result['year']):
+            return False
+        self.mark_url_processed(result['url'], result['year'], result['fingerprint'])
+        return True
+
     def _parse_standings_text_dash_format(self, text: str) -> List[Dict[str, str]]:
         """
         Parse standings text in dash-separated format (used in 2024-25 and earlier).
@@ -136,15 +379,15 @@ class NAIAScraper:
         standings = []
 
         # Check if format includes rank numbers (e.g., "1. School - Score")
-        if re.search(r'^\d+\.\s+\w+', text.strip()):
+        if _RE_HAS_RANK.search(text.strip()):
             # Tournament format: "1. School - Score 2. School - Score..."
             # Split by rank pattern (digit followed by period and space)
-            entries = re.split(r'\d+\.\s+', text)
+            entries = _RE_SPLIT_RANK.split(text)
             entries = [e.strip() for e in entries if e.strip()]
 
             for entry in entries:
                 # Parse "School - Score" format
-                match = re.match(r'^(.+?)\s*-\s*(\d+\.?\d*)$', entry)
+                match = _RE_SCHOOL_SCORE.match(entry)
                 if match:
                     school = match.group(1).strip()
                     score = match.group(2)
@@ -157,7 +400,7 @@ class NAIAScraper:
         else:
             # Original format: "School1 - Score1School2 - Score2..."
             # Split by numbers (scores), keeping the numbers
-            parts = re.split(r'(\d+\.?\d*)', text)
+            parts = _RE_SPLIT_SCORE.split(text)
             parts = [p.strip() for p in parts if p.strip() and p.strip() != '-']
 
             # Process in pairs: school, score
@@ -196,7 +439,7 @@ class NAIAScraper:
             return self._parse_standings_text_dash_format(text)
 
         # Insert delimiter before "digit(s) space uppercase-letter"
-        delimited = re.sub(r'(\d)\s+([A-Z])', r'\1||\2', text)
+        delimited = _RE_DIGIT_UPPER.sub(r'\1||\2', text)
 
         # Split by delimiter
         entries = [e.strip() for e in delimited.split('||') if e.strip()]
@@ -207,7 +450,7 @@ class NAIAScraper:
                 continue
 
             # Pattern: school name followed by 3-4 digits
-            match = re.match(r'^(.+?)\s+(\d{2,4})$', entry)
+            match = _RE_ENTRY.match(entry)
             if match:
                 school = match.group(1).strip()
                 score_combo = match.group(2)
@@ -247,7 +490,7 @@ class NAIAScraper:
         all_standings = []
 
         # Find all conference headers (in <strong> tags)
-        conf_headers = soup.find_all('strong', string=lambda text: text and 'Conference' in text)
+        conf_headers = soup.find_all('strong', string=_RE_CONFERENCE)
 
         print(f"Found {len(conf_headers)} conference sections")
 
@@ -294,13 +537,16 @@ class NAIAScraper:
 
         return all_standings
 
-    def update_csv_with_standings(self, standings_data: List[Dict[str, str]], year: int):
+    def update_csv_with_standings(self, standings_data: List[Dict[str, str]], year: int) -> bool:
         """
         Update the CSV file with scraped standings data.
 
         Args:
             standings_data: List of dictionaries with standings
             year: Year of the standings
+
+        Returns:
+            True if the CSV now holds the standings, False if it could not be updated
         """
         # Load current CSV data
         csv_data = self.csv_handler.read_csv(self.csv_file)
@@ -311,32 +557,62 @@ class NAIAScraper:
         year_column_name = f"{year} Conference Team Place"
         if year_column_name not in headers:
             print(f"Warning: Column '{year_column_name}' not found in CSV")
-            return
+            return False
 
         year_col_index = headers.index(year_column_name)
 
+        # The School column moved when Sport/Division/Gender were prepended
+        school_col_index = headers.index('School') if 'School' in headers else 1
+
+        # Lowercase each CSV school name once instead of per standing
+        rows_lower = [
+            (row[school_col_index].lower(), row)
+            for row in rows if len(row) > school_col_index
+        ]
+        exact_rows: Dict[str, List[str]] = {}
+        for csv_lower, row in rows_lower:
+            exact_rows.setdefault(csv_lower, row)
+
         # Update rows with standings
+        dirty = False
         for standing in standings_data:
             school_name = standing.get('school', '')
             place = standing.get('place', '')
-
-            # Find matching row in CSV (match school name)
-            for i, row in enumerate(rows):
-                if len(row) > 1:  # Ensure row has school name column
-                    csv_school = row[1]  # Column B (index 1) is school name
-
-                    # Match school name (case-insensitive, partial match)
-                    if school_name.lower() in csv_school.lower() or csv_school.lower() in school_name.lower():
-                        # Update the year column with the place
-                        while len(row) <= year_col_index:
-                            row.append('')
-                        row[year_col_index] = place
-                        print(f"Updated {csv_school} - {year}: {place}")
-                        break
-
-        # Write updated data back to CSV
-        self.csv_handler.write_csv(self.csv_file, headers, rows)
+            school_lower = school_name.lower()
+
+            # Exact name hit first, then the case-insensitive partial match
+            row = exact_rows.get(school_lower)
+            if row is None:
+                row = next(
+                    (r for csv_lower, r in rows_lower
+                     if school_lower in csv_lower or csv_lower in school_lower),
+                    None
+                )
+
+            if row is not None:
+                # Update the year column with the place
+                while len(row) <= year_col_index:
+                    row.append('')
+                if row[year_col_index] != place:
+                    row[year_col_index] = place
+                    dirty = True
+                    print(f"Updated {row[school_col_index]} - {year}: {place}")
+
+        if not dirty:
+            print(f"CSV already up to date with {year} standings")
+            return True
+
+        # Write to a temp file and swap it in, so a failed write can't corrupt the CSV
+        tmp_file = f"{self.csv_file}.tmp"
+        if not self.csv_handler.write_csv(tmp_file, headers, rows):
+            return False
+        try:
+            os.replace(tmp_file, self.csv_file)
+        except OSError as e:
+            print(f"Error replacing {self.csv_file}: {e}")
+            return False
         print(f"CSV updated with {year} standings")
+        return True
 
     def scrape_from_env(self):
         """
@@ -366,5 +642,5 @@ class NAIAScraper:
     def clear_processed_urls(self):
         """Clear the list of processed URLs (use with caution)."""
         self.processed_urls.clear()
-        self._save_processed_urls()
+        self.compact_processed_urls()
         print("Cleared all processed URLs")
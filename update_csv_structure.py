@@ -4,12 +4,14 @@ Update CSV files to include Sport, Division, and Gender columns
 """
 import csv
 
+# Values of the Sport, Division and Gender columns added to every row
+PREFIX = ['wrestling', 'naia', 'mens']
+
+# Output buffer; the whole CSV goes out in a handful of write() calls
+WRITE_BUFFER_SIZE = 1 << 20
+
 def update_csv(input_file, output_file, csv_type='main'):
     """Add sport, division, gender columns to CSV"""
-    with open(input_file, 'r', encoding='utf-8') as f_in:
-        reader = csv.DictReader(f_in)
-        rows = list(reader)
-
     if csv_type == 'main':
         # New fieldnames with sport, division, gender at the beginning
         fieldnames = [
@@ -37,19 +39,33 @@ def update_csv(input_file, output_file, csv_type='main'):
             'School'
         ]
 
-    # Update each row
-    for row in rows:
-        row['Sport'] = 'wrestling'
-        row['Division'] = 'naia'
-        row['Gender'] = 'mens'
+    # Stream rows from input to output so the file is never held in memory
+    with open(input_file, 'r', encoding='utf-8') as f_in, \
+            open(output_file, 'w', encoding='utf-8', newline='', buffering=WRITE_BUFFER_SIZE) as f_out:
+        reader = csv.reader(f_in)
+        writer = csv.writer(f_out)
+
+        # Position of each remaining output column in the input, None if absent
+        header = next(reader, [])
+        source = [header.index(name) if name in header else None for name in fieldnames[len(PREFIX):]]
+        writer.writerow(fieldnames)
+
+        count = 0
+
+        def output_rows():
+            # The loop variable doubles as the running row count
+            nonlocal count
+            if source == list(range(len(header))):
+                # Input already in output order: just prepend the constants
+                for count, row in enumerate(reader, 1):
+                    yield PREFIX + row
+            else:
+                for count, row in enumerate(reader, 1):
+                    yield PREFIX + [row[i] if i is not None and i < len(row) else '' for i in source]
 
-    # Write updated CSV
-    with open(output_file, 'w', encoding='utf-8', newline='') as f_out:
-        writer = csv.DictWriter(f_out, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(rows)
+        writer.writerows(output_rows())
 
-    print(f"✓ Updated {len(rows)} rows")
+    print(f"✓ Updated {count} rows")
     print(f"  Input:  {input_file}")
     print(f"  Output: {output_file}")
 
@@ -3,16 +3,46 @@ URL Finder module for discovering NAIA wrestling standings URLs.
 Uses Google search to find standings pages for different years.
 """
 import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import List, Dict, Optional
+from urllib.parse import urljoin
 from web_parser import WebParser
 
+# Standings page markers, compiled once at import
+_CONFERENCE_RE = re.compile('Conference')
+_KEYWORD_RE = re.compile(r'conference rating|conference team|standings|team place', re.IGNORECASE)
+# Link text worth following in explore_site_structure
+_LINK_KW_RE = re.compile(r'rating|standing|conference|team', re.IGNORECASE)
+# Year path segment, either a season ("/2024-25/") or a bare year ("/2024/")
+_YEAR_RE = re.compile(r'/(\d{4})(?:-\d{2})?/')
+
+# Discovery reruns reuse fetched pages from here for up to a day
+CACHE_DIR = '.http_cache'
+CACHE_TTL = 24 * 60 * 60
+
+
+@lru_cache(maxsize=None)
+def _shared_parser(cache_dir: Optional[str], cache_ttl: int) -> WebParser:
+    """One WebParser per cache setting, so every URLFinder reuses its session and connection pool"""
+    return WebParser(cache_dir=cache_dir, cache_ttl=cache_ttl)
+
 
 class URLFinder:
     """A class for finding NAIA wrestling standings URLs via search."""
 
-    def __init__(self):
-        """Initialize the URL Finder."""
-        self.parser = WebParser()
+    def __init__(self, cache_dir: Optional[str] = CACHE_DIR, cache_ttl: int = CACHE_TTL,
+                 parser: Optional[WebParser] = None):
+        """
+        Initialize the URL Finder.
+
+        Args:
+            cache_dir: Directory for the on-disk page cache (None disables it)
+            cache_ttl: Seconds a cached page is reused before revalidating
+            parser: WebParser to use, in which case cache_dir and cache_ttl are
+                ignored; by default a process-wide one per cache setting is shared
+        """
+        self.parser = parser if parser is not None else _shared_parser(cache_dir, cache_ttl)
         self.found_urls = {}
 
     def search_google_for_urls(self, query: str) -> List[str]:
@@ -35,49 +65,124 @@ class URLFinder:
         print(f"Would search Google for: {query}")
         return []
 
-    def find_naia_standings_urls(self, year: int) -> List[str]:
+    def _season(self, year: int) -> str:
         """
-        Find NAIA wrestling standings URLs for a specific year.
+        Convert a year to NAIA season format (e.g., 2024 -> 2024-25).
 
         Args:
-            year: Year to search for (2020-2025)
+            year: Year to convert
 
         Returns:
-            List of potential standings URLs
+            Season string used in NAIA URLs
         """
-        # Convert year to NAIA season format (e.g., 2024 -> 2024-25)
-        if year >= 2025:
-            season = f"{year}-{str(year+1)[-2:]}"
-        else:
-            season = f"{year}-{str(year+1)[-2:]}"
+        return f"{year}-{str(year+1)[-2:]}"
 
-        print(f"\nSearching for {season} season...")
+    def _candidate_urls(self, year: int) -> List[str]:
+        """
+        Build the standings URLs worth trying for a year.
 
-        # Try to directly construct potential URLs
-        potential_urls = [
+        Args:
+            year: Year to build URLs for
+
+        Returns:
+            List of candidate URLs
+        """
+        season = self._season(year)
+        return [
             f"https://www.naia.org/sports/mwrest/{season}/Releases/Conf",
             f"https://www.naia.org/sports/mwrest/{season}/Releases/Conf_1",
             f"https://www.naia.org/sports/mwrest/{season}/releases/conf",
             f"https://www.naia.org/sports/mwrest/{season}/standings",
         ]
 
-        # Test which URLs are valid
+    def _probe_urls(self, urls: List[str], max_workers: int) -> List[Optional[bool]]:
+        """
+        Probe several candidate URLs concurrently.
+
+        Args:
+            urls: URLs to probe
+            max_workers: Maximum number of pages fetched at once
+
+        Returns:
+            Results of _probe, in URL order
+        """
+        if not urls:
+            return []
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(urls))) as pool:
+            return list(pool.map(self._probe, urls))
+
+    def _probe(self, url: str) -> Optional[bool]:
+        """
+        Check whether a candidate URL exists and has standings data.
+
+        A HEAD request weeds out the (usual) 404s first; only pages that exist are
+        downloaded and checked with _has_standings_data.
+
+        Args:
+            url: URL to probe
+
+        Returns:
+            True if the page has standings data, False if it exists without any,
+            or None if the page is missing or the fetch fails
+        """
+        html = self.parser.cached_page(url)
+        if html:
+            return self._has_standings_data(self.parser.parse_html(html))
+
+        status = self.parser.head(url)
+        # Some servers refuse HEAD outright; fall back to a plain GET for those
+        if status != 200 and status not in (405, 501):
+            return None
+
+        soup = self.parser.get_soup(url)
+        return self._has_standings_data(soup) if soup else None
+
+    def _select_valid(self, urls: List[str], results: List[Optional[bool]]) -> List[str]:
+        """
+        Report on probed candidate pages and keep those with standings data.
+
+        Args:
+            urls: Candidate URLs
+            results: Probe results matching urls
+
+        Returns:
+            List of URLs whose pages have standings data
+        """
         valid_urls = []
-        for url in potential_urls:
-            print(f"Testing: {url}")
-            soup = self.parser.get_soup(url)
-            if soup:
-                # Check if page has conference standings data
-                if self._has_standings_data(soup):
-                    print(f"  ✓ Found valid standings page!")
-                    valid_urls.append(url)
-                else:
-                    print(f"  ✗ Page exists but no standings data")
+        # Collect the report and print it in one go rather than line by line
+        report = []
+        for url, has_data in zip(urls, results):
+            report.append(f"Testing: {url}")
+            if has_data:
+                report.append("  ✓ Found valid standings page!")
+                valid_urls.append(url)
+            elif has_data is not None:
+                report.append("  ✗ Page exists but no standings data")
             else:
-                print(f"  ✗ URL not found")
+                report.append("  ✗ URL not found")
 
+        print("\n".join(report))
         return valid_urls
 
+    def find_naia_standings_urls(self, year: int, max_workers: int = 8) -> List[str]:
+        """
+        Find NAIA wrestling standings URLs for a specific year.
+
+        Candidate pages are fetched concurrently; results are reported in order.
+
+        Args:
+            year: Year to search for (2020-2025)
+            max_workers: Maximum number of pages fetched at once
+
+        Returns:
+            List of potential standings URLs
+        """
+        print(f"\nSearching for {self._season(year)} season...")
+
+        # Try to directly construct potential URLs and test which are valid
+        potential_urls = self._candidate_urls(year)
+        return self._select_valid(potential_urls, self._probe_urls(potential_urls, max_workers))
+
     def _has_standings_data(self, soup) -> bool:
         """
         Check if a page contains standings data.
@@ -88,35 +193,38 @@ class URLFinder:
         Returns:
             True if page has standings data
         """
-        # Look for conference headers
-        conf_headers = soup.find_all('strong', string=lambda text: text and 'Conference' in text)
-
-        # Look for keywords in page content
-        page_text = soup.get_text().lower()
-        has_keywords = any(keyword in page_text for keyword in [
-            'conference rating',
-            'conference team',
-            'standings',
-            'team place'
-        ])
+        # Look for conference headers; a single hit is enough
+        if soup.find('strong', string=_CONFERENCE_RE) is not None:
+            return True
 
-        return len(conf_headers) > 0 or has_keywords
+        # Look for keywords in page content in one case-insensitive pass
+        return _KEYWORD_RE.search(soup.get_text()) is not None
 
-    def find_all_years(self, start_year: int = 2020, end_year: int = 2025) -> Dict[int, List[str]]:
+    def find_all_years(self, start_year: int = 2020, end_year: int = 2025,
+                       max_workers: int = 8) -> Dict[int, List[str]]:
         """
         Find standings URLs for multiple years.
 
+        Every year's candidates share one thread pool, so the whole scan takes
+        roughly as long as the slowest few requests rather than all of them.
+
         Args:
             start_year: Starting year (default 2020)
             end_year: Ending year (default 2025)
+            max_workers: Maximum number of pages fetched at once
 
         Returns:
             Dictionary mapping year to list of URLs
         """
+        candidates = {year: self._candidate_urls(year) for year in range(start_year, end_year + 1)}
+        all_urls = [url for urls in candidates.values() for url in urls]
+        probed = dict(zip(all_urls, self._probe_urls(all_urls, max_workers)))
+
         results = {}
 
-        for year in range(start_year, end_year + 1):
-            urls = self.find_naia_standings_urls(year)
+        for year, potential_urls in candidates.items():
+            print(f"\nSearching for {self._season(year)} season...")
+            urls = self._select_valid(potential_urls, [probed[url] for url in potential_urls])
             if urls:
                 results[year] = urls
                 print(f"\n✓ Found {len(urls)} URL(s) for {year}")
@@ -137,36 +245,33 @@ class URLFinder:
         """
         print(f"\nExploring: {base_url}")
 
-        soup = self.parser.get_soup(base_url)
-        if not soup:
+        html = self.parser.fetch_page(base_url)
+        if not html:
             print("Failed to fetch page")
             return []
 
-        # Find all links on the page
-        links = self.parser.extract_links(soup)
+        # Find all links on the page; only anchors matter, so skip building a soup
+        links = self.parser.extract_links_fast(html)
 
         # Filter for links that might be standings
         standings_links = []
         for link in links:
             href = link.get('href', '')
-            text = link.get('text', '').lower()
+            text = link.get('text', '')
 
             # Look for links with keywords
-            if any(keyword in text for keyword in ['rating', 'standing', 'conference', 'team']):
-                # Convert relative URLs to absolute
-                if href.startswith('/'):
-                    href = 'https://www.naia.org' + href
-                elif not href.startswith('http'):
-                    href = base_url + '/' + href
+            if _LINK_KW_RE.search(text):
+                # Convert relative URLs to absolute, the way a browser would
+                href = urljoin(base_url, href)
 
                 standings_links.append({
                     'url': href,
                     'text': text
                 })
 
-        print(f"Found {len(standings_links)} potential links")
-        for link in standings_links[:10]:  # Show first 10
-            print(f"  - {link['text']}: {link['url']}")
+        report = [f"Found {len(standings_links)} potential links"]
+        report.extend(f"  - {link['text']}: {link['url']}" for link in standings_links[:10])  # Show first 10
+        print("\n".join(report))
 
         return [link['url'] for link in standings_links]
 
@@ -181,15 +286,8 @@ class URLFinder:
             Year as integer, or None if not found
         """
         # Look for pattern like "2024-25" or "2024"
-        match = re.search(r'/(\d{4})-\d{2}/', url)
-        if match:
-            return int(match.group(1))
-
-        match = re.search(r'/(\d{4})/', url)
-        if match:
-            return int(match.group(1))
-
-        return None
+        match = _YEAR_RE.search(url)
+        return int(match.group(1)) if match else None
 
     def save_urls_to_file(self, urls_by_year: Dict[int, List[str]], filename: str = "found_urls.txt"):
         """
@@ -199,15 +297,14 @@ class URLFinder:
             urls_by_year: Dictionary of year -> URLs
             filename: Output filename
         """
+        # Build the whole file first and hand it to a single write()
+        parts = ["# NAIA Wrestling Standings URLs\n# Found by URL Finder\n\n"]
+        for year in sorted(urls_by_year.keys()):
+            parts.append(f"# Year: {year}\n")
+            parts.extend(f"{url}\n" for url in urls_by_year[year])
+            parts.append("\n")
+
         with open(filename, 'w') as f:
-            f.write("# NAIA Wrestling Standings URLs\n")
-            f.write("# Found by URL Finder\n\n")
-
-            for year in sorted(urls_by_year.keys()):
-                urls = urls_by_year[year]
-                f.write(f"# Year: {year}\n")
-                for url in urls:
-                    f.write(f"{url}\n")
-                f.write("\n")
+            f.write("".join(parts))
 
         print(f"\nSaved URLs to {filename}")
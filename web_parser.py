@@ -1,26 +1,61 @@
 """
 Web scraping module for parsing website content.
 """
+import hashlib
+import html as html_lib
+import os
+import re
+import threading
+import time
+from pathlib import Path
+import orjson
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from bs4 import BeautifulSoup, SoupStrainer
+from lxml import etree
 from typing import Optional, Dict, List, Any
 
+# Connection pool sizing: host pools kept alive, and sockets per host.
+# POOL_MAXSIZE covers NAIAScraper.scrape_many's worker threads hitting one host.
+POOL_CONNECTIONS = 8
+POOL_MAXSIZE = 32
+
+# Anchor tags with an href, and any tag, for extract_links_fast
+_A_RE = re.compile(r'<a\b[^>]*?\bhref\s*=\s*["\']([^"\']+)["\'][^>]*>(.*?)</a\s*>', re.IGNORECASE | re.DOTALL)
+_TAG_RE = re.compile(r'<[^>]+>')
+
+# Pass as parse_only when a page is only needed for extract_table/extract_links;
+# a matched <table> keeps its whole subtree, so rows and cells survive
+TABLES_AND_LINKS = SoupStrainer(['table', 'a'])
+
 
 class WebParser:
     """A class for parsing and scraping web pages."""
 
-    def __init__(self, base_url: Optional[str] = None):
+    def __init__(self, base_url: Optional[str] = None, cache_dir: Optional[str] = None,
+                 cache_ttl: int = 0):
         """
         Initialize the WebParser.
 
         Args:
             base_url: Optional base URL for relative URL resolution
+            cache_dir: Directory for an on-disk page cache (disabled if None)
+            cache_ttl: Seconds a cached page is served without asking the server;
+                after that it is revalidated with a conditional GET
         """
         self.base_url = base_url
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.cache_ttl = cache_ttl
+        if self.cache_dir:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         })
+        # Reuse TCP/TLS connections across requests to the same host
+        adapter = HTTPAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
 
     def fetch_page(self, url: str) -> Optional[str]:
         """
@@ -32,40 +67,123 @@ class WebParser:
         Returns:
             HTML content as string, or None if request fails
         """
+        entry = self._cache_load(url) if self.cache_dir else None
+        if entry and time.time() - entry['ts'] < self.cache_ttl:
+            return entry['html']
+
+        headers = {}
+        if entry:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+
         try:
-            response = self.session.get(url, timeout=10)
+            response = self.session.get(url, timeout=10, headers=headers)
+            if entry and response.status_code == 304:
+                # Unchanged on the server; restart the TTL and reuse the stored body
+                entry['ts'] = time.time()
+                self._cache_save(url, entry)
+                return entry['html']
             response.raise_for_status()
-            return response.text
         except requests.RequestException as e:
             print(f"Error fetching {url}: {e}")
             return None
 
-    def parse_html(self, html: str, parser: str = 'lxml') -> BeautifulSoup:
+        html = response.text
+        if self.cache_dir:
+            self._cache_save(url, {
+                'url': url,
+                'etag': response.headers.get('ETag'),
+                'last_modified': response.headers.get('Last-Modified'),
+                'ts': time.time(),
+                'html': html,
+            })
+        return html
+
+    def cached_page(self, url: str) -> Optional[str]:
+        """
+        Return a cached page that is still within cache_ttl, without any network I/O.
+
+        Args:
+            url: The URL to look up
+
+        Returns:
+            HTML content as string, or None if not cached or expired
+        """
+        entry = self._cache_load(url) if self.cache_dir else None
+        if entry and time.time() - entry['ts'] < self.cache_ttl:
+            return entry['html']
+        return None
+
+    def _cache_path(self, url: str) -> Path:
+        """Cache file for a URL"""
+        return self.cache_dir / f"{hashlib.sha256(url.encode('utf-8')).hexdigest()[:32]}.json"
+
+    def _cache_load(self, url: str) -> Optional[Dict[str, Any]]:
+        """Read a URL's cache entry, or None if missing or unreadable"""
+        try:
+            entry = orjson.loads(self._cache_path(url).read_bytes())
+        except (OSError, orjson.JSONDecodeError):
+            return None
+        return entry if entry.get('url') == url else None
+
+    def _cache_save(self, url: str, entry: Dict[str, Any]) -> None:
+        """Write a URL's cache entry, swapping it in atomically"""
+        path = self._cache_path(url)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            tmp_path.write_bytes(orjson.dumps(entry))
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"Error writing cache for {url}: {e}")
+
+    def head(self, url: str) -> Optional[int]:
+        """
+        Send a HEAD request to check a URL without downloading its body.
+
+        Args:
+            url: The URL to check
+
+        Returns:
+            HTTP status code after redirects, or None if the request fails
+        """
+        try:
+            return self.session.head(url, timeout=5, allow_redirects=True).status_code
+        except requests.RequestException as e:
+            print(f"Error checking {url}: {e}")
+            return None
+
+    def parse_html(self, html: str, parser: str = 'lxml',
+                   parse_only: Optional[SoupStrainer] = None) -> BeautifulSoup:
         """
         Parse HTML content into BeautifulSoup object.
 
         Args:
             html: HTML content as string
             parser: Parser to use (default: 'lxml')
+            parse_only: Optional SoupStrainer; only matching tags (and their
+                contents) are built into the tree
 
         Returns:
             BeautifulSoup object
         """
-        return BeautifulSoup(html, parser)
+        return BeautifulSoup(html, parser, parse_only=parse_only)
 
-    def get_soup(self, url: str) -> Optional[BeautifulSoup]:
+    def get_soup(self, url: str, parse_only: Optional[SoupStrainer] = None) -> Optional[BeautifulSoup]:
         """
         Fetch and parse a URL in one step.
 
         Args:
             url: The URL to fetch and parse
+            parse_only: Optional SoupStrainer passed on to parse_html
 
         Returns:
             BeautifulSoup object, or None if fetch fails
         """
         html = self.fetch_page(url)
         if html:
-            return self.parse_html(html)
+            return self.parse_html(html, parse_only=parse_only)
         return None
 
     def extract_table(self, soup: BeautifulSoup, table_id: Optional[str] = None,
@@ -99,6 +217,42 @@ class WebParser:
 
         return rows
 
+    def extract_table_fast(self, html: str, table_id: Optional[str] = None) -> List[List[str]]:
+        """
+        Extract table data straight from HTML with lxml, skipping BeautifulSoup.
+
+        Same output as extract_table, but the tree walk and text extraction run
+        in lxml's C code, which pays off on large standings tables.
+
+        Args:
+            html: HTML content as string
+            table_id: ID of the table to extract (first table if omitted)
+
+        Returns:
+            List of rows, where each row is a list of cell values
+        """
+        tree = etree.HTML(html)
+        if tree is None:
+            return []
+
+        if table_id:
+            tables = tree.xpath('//table[@id=$table_id]', table_id=table_id)
+        else:
+            tables = tree.xpath('//table')
+
+        if not tables:
+            return []
+
+        rows = []
+        for tr in tables[0].iterdescendants('tr'):
+            # Strip each text fragment and join, like get_text(strip=True)
+            cells = [''.join(text.strip() for text in cell.xpath('.//text()'))
+                     for cell in tr.iterdescendants('td', 'th')]
+            if cells:
+                rows.append(cells)
+
+        return rows
+
     def extract_links(self, soup: BeautifulSoup, selector: Optional[str] = None) -> List[Dict[str, str]]:
         """
         Extract links from HTML.
@@ -120,6 +274,28 @@ class WebParser:
             for link in links if link.get('href')
         ]
 
+    def extract_links_fast(self, html: str) -> List[Dict[str, str]]:
+        """
+        Extract links straight from HTML with a regex, skipping the parse tree.
+
+        Meant for link crawling where only <a href> matters; nested or malformed
+        anchors may come out differently than with extract_links.
+
+        Args:
+            html: HTML content as string
+
+        Returns:
+            List of dictionaries with 'text' and 'href' keys
+        """
+        return [
+            {
+                # Strip each text fragment and join, like get_text(strip=True)
+                'text': ''.join(html_lib.unescape(part).strip() for part in _TAG_RE.split(inner)),
+                'href': html_lib.unescape(href)
+            }
+            for href, inner in _A_RE.findall(html)
+        ]
+
     def extract_by_selector(self, soup: BeautifulSoup, selector: str) -> List[str]:
         """
         Extract elements by CSS selector.